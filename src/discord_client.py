@@ -2,11 +2,18 @@
 
 import inspect
 import logging
+import math
 import random
-import re
 import time
-from datetime import datetime
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import date, datetime
+from itertools import accumulate
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any, NotRequired, TypedDict, cast
+from urllib.parse import quote
 
 import requests
 from discord_webhook import DiscordEmbed, DiscordWebhook
@@ -23,6 +30,12 @@ class DiscordMediaItem(TypedDict):
 
 logger = logging.getLogger(__name__)
 
+# Sort key for media items by their added date
+_ADDED_AT = itemgetter("added_at")
+
+# Translation table prefixing each title-altering markdown metacharacter with a backslash
+_TITLE_MARKDOWN_ESCAPES = str.maketrans({char: f"\\{char}" for char in "\\`*_~[]"})
+
 
 def _escape_title_markdown(text: str) -> str:
     """
@@ -36,8 +49,82 @@ def _escape_title_markdown(text: str) -> str:
     Returns:
         Text with markdown characters escaped
     """
-    markdown_chars = r"([\\`*_~\[\]])"
-    return re.sub(markdown_chars, r"\\\1", text)
+    return text.translate(_TITLE_MARKDOWN_ESCAPES)
+
+
+def _iso_date_to_day_month(value: str) -> str | None:
+    """
+    Reformat an ISO date for field names by slicing, without a strptime/strftime round trip.
+
+    Args:
+        value: Date string expected as YYYY-MM-DD
+
+    Returns:
+        The date as DD/MM, or None if the value is not a real YYYY-MM-DD date
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return None
+    year, month, day = value[:4], value[5:7], value[8:]
+    if not (year + month + day).isdecimal():
+        return None
+    try:
+        # Rejects impossible dates such as 2025-02-30, as strptime did
+        date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+    return f"{day}/{month}"
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter that only blocks once the burst capacity is used up."""
+
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum number of requests that can be sent back-to-back
+            refill_rate: Tokens regained per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.resume_at = 0.0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill, capped at capacity."""
+        now = time.monotonic()
+        self.tokens = min(float(self.capacity), self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold off all sends until the server-side bucket resets.
+
+        Args:
+            seconds: Time until Discord reports the rate limit bucket resets
+        """
+        self.tokens = 0.0
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+    def acquire(self) -> None:
+        """Take one token, sleeping only as long as needed for one to become available."""
+        pause_remaining = self.resume_at - time.monotonic()
+        if pause_remaining > 0:
+            logger.debug("Discord rate limit bucket exhausted: waiting %.2fs for reset", pause_remaining)
+            time.sleep(pause_remaining)
+            # The server-side bucket is full again once the reset window has passed
+            self.tokens = float(self.capacity)
+            self.last_refill = time.monotonic()
+        self.resume_at = 0.0
+        self._refill()
+        if self.tokens < 1:
+            wait_time = (1 - self.tokens) / self.refill_rate
+            logger.debug("Discord rate limiter: waiting %.2fs before next send", wait_time)
+            time.sleep(wait_time)
+            self._refill()
+        self.tokens -= 1
 
 
 class DiscordNotifier:
@@ -47,26 +134,57 @@ class DiscordNotifier:
     MAX_FIELD_VALUE = 1024
     MAX_ITEMS_TOTAL = 25  # Discord embed hard limit: 25 fields per embed
     MAX_EMBED_SIZE = 5800  # Maximum embed character count (safety margin below Discord's 6000 limit)
+    MAX_EMBEDS_PER_MESSAGE = 10  # Discord limit; MAX_EMBED_SIZE also caps the combined size of a message's embeds
 
     # Retry configuration
     MAX_SEND_RETRIES = 3
     RETRY_BACKOFF_BASE = 2  # Exponential backoff base (1s, 2s, 4s, ...)
     REQUEST_TIMEOUT_SECONDS = 15
 
+    # Client-side pacing (Discord allows roughly 5 requests per 2 seconds per webhook)
+    RATE_LIMIT_CAPACITY = 5
+    RATE_LIMIT_REFILL_PER_SECOND = 2.5
+    RETRY_JITTER_SECONDS = 0.5  # Random extra delay on 429 so parallel senders don't retry in lockstep
+
     # Embed trimming configuration
     MAX_TRIM_ATTEMPTS = 5
     TRIM_REDUCTION_FACTOR = 0.8  # Reduce by 20% on each attempt
 
-    # Emoji icons for media types
-    MEDIA_ICONS = {
-        "Movies": "🎬",
-        "TV Shows": "📺",
-        "TV Seasons": "📺",
-        "TV Episodes": "📺",
-        "Music Albums": "💿",
-        "Music Tracks": "🎵",
-        "Other": "📁",
-    }
+    # Emoji icons for media types (read-only view so the shared class attribute can't be mutated)
+    MEDIA_ICONS: Mapping[str, str] = MappingProxyType(
+        {
+            "Movies": "🎬",
+            "TV Shows": "📺",
+            "TV Seasons": "📺",
+            "TV Episodes": "📺",
+            "Music Albums": "💿",
+            "Music Tracks": "🎵",
+            "Other": "📁",
+        }
+    )
+
+    # Tautulli media type -> display category (unlisted types fall back to "Other")
+    _TYPE_TO_CATEGORY: Mapping[str, str] = MappingProxyType(
+        {
+            "movie": "Movies",
+            "show": "TV Shows",
+            "season": "TV Seasons",
+            "episode": "TV Episodes",
+            "album": "Music Albums",
+            "track": "Music Tracks",
+        }
+    )
+
+    # Display order for categories
+    CATEGORY_ORDER = (
+        "Movies",
+        "TV Shows",
+        "TV Seasons",
+        "TV Episodes",
+        "Music Albums",
+        "Music Tracks",
+        "Other",
+    )
 
     # Singular display names for each category
     CATEGORY_SINGULAR = {
@@ -90,20 +208,20 @@ class DiscordNotifier:
         "Other": "items",
     }
 
-    # Friendly empty-state messages when no new media is found
-    NO_NEW_TITLES = [
+    # Friendly empty-state messages when no new media is found (tuples: immutable, cheap for random.choice)
+    NO_NEW_TITLES = (
         "🛋️ Quiet Plex vibes",
         "🍃 Nothing new this round",
         "📭 No fresh arrivals",
         "🌙 Calm library check-in",
-    ]
+    )
 
-    NO_NEW_MESSAGES = [
+    NO_NEW_MESSAGES = (
         "No new releases in the last {days} {day_word}. Time to add something awesome to the library 🍿",
         "Your Plex library stayed peaceful for {days} {day_word}. Maybe tonight is a perfect time to queue a new download ✨",
         "Nothing new landed in the past {days} {day_word}. Give your future self a surprise and add something fun 🎬",
         "No new content in {days} {day_word}. Friendly reminder: your watchlist won’t fill itself 😄",
-    ]
+    )
 
     def __init__(self, webhook_url: str, plex_url: str | None = None, plex_server_id: str | None = None):
         """
@@ -118,10 +236,22 @@ class DiscordNotifier:
         self.plex_url = plex_url.rstrip("/") if plex_url else None
         self.plex_server_id = plex_server_id
 
+        # Item links only vary by rating key, so build the constant part once
+        self._link_prefix: str | None = None
+        if self.plex_url and self.plex_server_id:
+            # Plex.tv uses the desktop app route, local servers use the bundled web client
+            web_path = "desktop" if "plex.tv" in self.plex_url.lower() else "web/index.html"
+            metadata_key = quote("/library/metadata/", safe="")
+            self._link_prefix = f"{self.plex_url}/{web_path}#!/server/{self.plex_server_id}/details?key={metadata_key}"
+
+        # Formatted item lines, reused across trim attempts and parts within one send
+        self._formatted_items: dict[tuple[str, Any], str] = {}
+        self._rate_limiter = _TokenBucket(self.RATE_LIMIT_CAPACITY, self.RATE_LIMIT_REFILL_PER_SECOND)
+
     def send_summary(self, media_items: list[DiscordMediaItem], days_back: int, total_count: int) -> bool:
         """
         Send media summary to Discord as rich embed(s), grouped by category.
-        Sends separate messages for each media type (Movies, TV Shows, etc.).
+        Each media type (Movies, TV Shows, etc.) gets its own embed; small embeds share a webhook request.
 
         Args:
             media_items: List of media items with 'type', 'title', 'added_at' keys
@@ -136,6 +266,7 @@ class DiscordNotifier:
                 webhook = DiscordWebhook(url=self.webhook_url)
                 webhook.add_embed(self._create_no_new_items_embed(days_back))
 
+                self._rate_limiter.acquire()
                 response = self._send_with_retry(webhook)
                 if response.status_code in [200, 204]:
                     logger.info("✅ Discord no-new-items notification sent")
@@ -151,94 +282,82 @@ class DiscordNotifier:
                     )
                 return False
 
-            # Group items by type
-            grouped = self._group_items_by_type(media_items)
-
-            # Category order for display
-            category_order = [
-                "Movies",
-                "TV Shows",
-                "TV Seasons",
-                "TV Episodes",
-                "Music Albums",
-                "Music Tracks",
-                "Other",
+            self._formatted_items.clear()
+
+            # Group items by type, keeping only populated categories in display order
+            grouped = self._group_items_by_type(self._dedupe_items(media_items))
+            # One timestamp for every embed in this summary
+            footer_text = self._generated_footer_text()
+
+            # Build every embed up front, then pack consecutive embeds into as few requests as Discord allows.
+            # Requests go out one at a time so Discord shows the categories in CATEGORY_ORDER.
+            planned = [
+                (category, part_num, embed, items_sent)
+                for category in self.CATEGORY_ORDER
+                if category in grouped
+                for part_num, (embed, items_sent) in enumerate(
+                    self._build_category_messages(category, grouped[category], days_back, footer_text), start=1
+                )
             ]
+            batches = self._pack_embeds(planned)
 
+            items_remaining = {category: len(items) for category, items in grouped.items()}
+            failed_categories: set[str] = set()
             total_messages = 0
             success_count = 0
 
-            # Send messages for each category
-            for category in category_order:
-                items = grouped.get(category, [])
-                if not items:
+            for packed in batches:
+                # Once part of a category fails, skip the rest of that category
+                batch = [message for message in packed if message[0] not in failed_categories]
+                if not batch:
                     continue
 
-                # Sort items by date (ascending - oldest first)
-                items.sort(key=lambda x: x.get("added_at", ""))
-
-                # Send items in chunks, handling dynamic sizing based on validation
-                items_remaining = items[:]
-                part_num = 1
-
-                while items_remaining:
-                    total_messages += 1
-
-                    # Try to send a chunk (start with MAX_ITEMS_TOTAL)
-                    chunk = items_remaining[: self.MAX_ITEMS_TOTAL]
+                total_messages += 1
 
-                    webhook = DiscordWebhook(url=self.webhook_url)
-
-                    # Create and validate embed - this may trim items if too large
-                    embed, items_sent = self._validate_and_trim_embed(
-                        category, chunk, days_back, part_num, len(items), items_remaining
-                    )
+                webhook = DiscordWebhook(url=self.webhook_url)
+                for _category, _part_num, embed, _items_sent in batch:
                     webhook.add_embed(embed)
 
-                    # Send with retry logic
-                    response = self._send_with_retry(webhook)
-
-                    if response.status_code in [200, 204]:
-                        success_count += 1
+                # Send with retry logic, pacing requests to stay under Discord's rate limit
+                self._rate_limiter.acquire()
+                response = self._send_with_retry(webhook)
 
-                        # Remove sent items from remaining
-                        items_remaining = items_remaining[items_sent:]
+                if response.status_code in [200, 204]:
+                    success_count += 1
 
-                        if items_remaining:
+                    for category, part_num, _embed, items_sent in batch:
+                        items_remaining[category] -= items_sent
+                        if items_remaining[category]:
                             logger.info(
                                 "✅ Discord notification sent: %s (part %d, %d items sent, %d remaining)",
                                 category,
                                 part_num,
                                 items_sent,
-                                len(items_remaining),
+                                items_remaining[category],
                             )
                         else:
-                            logger.info("✅ Discord notification sent: %s (%d items total)", category, len(items))
-
-                        part_num += 1
-
-                        # Small delay between messages to avoid rate limits
-                        if items_remaining:
-                            time.sleep(0.5)
-                    elif response.status_code == 400:
-                        logger.error(
-                            "Discord rejected message (invalid payload): %s (%s part %d). "
-                            "Embed may be malformed or exceed limits. Skipping remaining %d items.",
-                            response.text,
-                            category,
-                            part_num,
-                            len(items_remaining),
-                        )
-                        break  # Stop trying to send this category
-                    else:
-                        logger.error(
-                            "Discord webhook failed with status %d: %s (%s part %d)",
-                            response.status_code,
-                            response.text,
-                            category,
-                            part_num,
-                        )
-                        break  # Stop trying to send this category
+                            logger.info(
+                                "✅ Discord notification sent: %s (%d items total)", category, len(grouped[category])
+                            )
+                    continue
+
+                batch_categories = list(dict.fromkeys(message[0] for message in batch))
+                failed_categories.update(batch_categories)
+                if response.status_code == 400:
+                    logger.error(
+                        "Discord rejected message (invalid payload): %s (%s). "
+                        "Embed may be malformed or exceed limits. Skipping remaining %d items.",
+                        response.text,
+                        ", ".join(batch_categories),
+                        sum(items_remaining[category] for category in batch_categories),
+                    )
+                else:
+                    logger.error(
+                        "Discord webhook failed with status %d: %s (%s)",
+                        response.status_code,
+                        response.text,
+                        ", ".join(batch_categories),
+                    )
 
             if success_count == total_messages:
                 logger.info("✅ All Discord notifications sent (%d/%d messages)", success_count, total_messages)
@@ -260,6 +379,78 @@ class DiscordNotifier:
             logger.exception("Unexpected error sending Discord notification: %s", e)
             return False
 
+    def _build_category_messages(
+        self, category: str, items: list[DiscordMediaItem], days_back: int, footer_text: str | None = None
+    ) -> list[tuple[DiscordEmbed, int]]:
+        """
+        Split a category's items into embeds that each fit Discord's limits.
+
+        Args:
+            category: Media category name
+            items: All media items in this category (sorted in place, oldest first)
+            days_back: Number of days in the summary
+            footer_text: Footer shared by all embeds (default: current time)
+
+        Returns:
+            List of (embed, number of items in that embed) tuples in send order
+        """
+        # Sort items by date (ascending - oldest first). Keys are computed before any reordering,
+        # so a KeyError leaves the list untouched for the slower fallback.
+        try:
+            items.sort(key=_ADDED_AT)
+        except KeyError:
+            items.sort(key=lambda x: x.get("added_at", ""))
+
+        # Title and description are identical for every part and trim attempt of the category
+        heading = self._category_heading(category, days_back, len(items))
+        messages: list[tuple[DiscordEmbed, int]] = []
+        items_remaining = items[:]
+        part_num = 1
+
+        while items_remaining:
+            # Try to fit a full chunk (MAX_ITEMS_TOTAL); validation trims it if the embed is too large
+            chunk = items_remaining[: self.MAX_ITEMS_TOTAL]
+            embed, items_sent = self._validate_and_trim_embed(
+                category, chunk, heading, part_num, items_remaining, footer_text
+            )
+            messages.append((embed, items_sent))
+            items_remaining = items_remaining[items_sent:]
+            part_num += 1
+
+        return messages
+
+    def _pack_embeds(
+        self, messages: list[tuple[str, int, DiscordEmbed, int]]
+    ) -> list[list[tuple[str, int, DiscordEmbed, int]]]:
+        """
+        Group consecutive embeds into webhook requests, keeping the original order.
+
+        Discord accepts up to MAX_EMBEDS_PER_MESSAGE embeds per request as long as their combined
+        size stays under the message limit, and each request costs a single rate-limit token.
+
+        Args:
+            messages: (category, part number, embed, item count) tuples in send order
+
+        Returns:
+            List of batches, each sent as one webhook request
+        """
+        batches: list[list[tuple[str, int, DiscordEmbed, int]]] = []
+        current: list[tuple[str, int, DiscordEmbed, int]] = []
+        current_size = 0
+
+        for message in messages:
+            size = self._calculate_embed_size(message[2])
+            if current and (len(current) >= self.MAX_EMBEDS_PER_MESSAGE or current_size + size > self.MAX_EMBED_SIZE):
+                batches.append(current)
+                current = []
+                current_size = 0
+            current.append(message)
+            current_size += size
+
+        if current:
+            batches.append(current)
+        return batches
+
     def _create_no_new_items_embed(self, days_back: int) -> DiscordEmbed:
         """Create a friendly embed for periods with no new items."""
         day_word = "day" if days_back == 1 else "days"
@@ -275,28 +466,16 @@ class DiscordNotifier:
         self,
         category: str,
         items: list[DiscordMediaItem],
-        days_back: int,
+        heading: tuple[str, str],
         part_num: int,
         estimated_parts: int,
-        category_total: int,
+        footer_text: str | None = None,
     ) -> DiscordEmbed:
-        """Create Discord embed for a specific category."""
-        date_range = f"Last {days_back} day{'s' if days_back != 1 else ''}"
-        icon = self.MEDIA_ICONS.get(category, "📁")
+        """Create Discord embed for a specific category from its (title, description) heading."""
+        base_title, description = heading
 
         # Build title
-        if estimated_parts > 1 or part_num > 1:
-            title = f"{icon} {category} - {date_range} (Part {part_num})"
-        else:
-            title = f"{icon} {category} - {date_range}"
-
-        # Build description - just show category count to avoid confusion
-        if category_total == 1:
-            label = self.CATEGORY_SINGULAR.get(category, category.rstrip("s").lower())
-            description = f"**{category_total} {label} added**"
-        else:
-            label = self.CATEGORY_PLURAL.get(category, category.lower())
-            description = f"**{category_total} {label} added**"
+        title = f"{base_title} (Part {part_num})" if estimated_parts > 1 or part_num > 1 else base_title
 
         embed = DiscordEmbed(title=title, description=description, color=0x57F287)  # Green color
 
@@ -304,11 +483,39 @@ class DiscordNotifier:
         self._add_items_to_embed(embed, items, category)
 
         # Add footer with timestamp
-        embed.set_footer(text=f"Generated on {datetime.now().astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        embed.set_footer(text=footer_text or self._generated_footer_text())
         embed.set_timestamp()
 
         return embed
 
+    def _category_heading(self, category: str, days_back: int, category_total: int) -> tuple[str, str]:
+        """
+        Build the title (without part number) and description shared by every part of a category.
+
+        Args:
+            category: Media category name
+            days_back: Number of days in the summary
+            category_total: Total items in this category
+
+        Returns:
+            Tuple of (title, description)
+        """
+        date_range = f"Last {days_back} day{'s' if days_back != 1 else ''}"
+        icon = self.MEDIA_ICONS.get(category, "📁")
+
+        # Description just shows the category count to avoid confusion
+        if category_total == 1:
+            label = self.CATEGORY_SINGULAR.get(category, category.rstrip("s").lower())
+        else:
+            label = self.CATEGORY_PLURAL.get(category, category.lower())
+
+        return f"{icon} {category} - {date_range}", f"**{category_total} {label} added**"
+
+    @staticmethod
+    def _generated_footer_text() -> str:
+        """Footer text stamping an embed with the local time it was generated."""
+        return f"Generated on {datetime.now().astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')}"
+
     def _calculate_embed_size(self, embed: DiscordEmbed) -> int:
         """
         Calculate the approximate total character count of an embed.
@@ -355,10 +562,10 @@ class DiscordNotifier:
         self,
         category: str,
         items: list[DiscordMediaItem],
-        days_back: int,
+        heading: tuple[str, str],
         part_num: int,
-        category_total: int,
         all_items: list[DiscordMediaItem],
+        footer_text: str | None = None,
     ) -> tuple[DiscordEmbed, int]:
         """
         Create embed and validate size, trimming items if necessary to stay under Discord limits.
@@ -366,10 +573,10 @@ class DiscordNotifier:
         Args:
             category: Media category name
             items: List of media items to attempt to include
-            days_back: Number of days in the summary
+            heading: Category (title, description) from _category_heading
             part_num: Current part number
-            category_total: Total items in this category
             all_items: All remaining items (for calculating parts)
+            footer_text: Footer shared by all embeds (default: current time)
 
         Returns:
             Tuple of (DiscordEmbed, number of items actually included)
@@ -382,7 +589,7 @@ class DiscordNotifier:
             estimated_parts = (len(all_items) + items_per_part - 1) // items_per_part if items_per_part > 0 else 1
 
             embed = self._create_category_embed(
-                category, current_items, days_back, part_num, estimated_parts, category_total
+                category, current_items, heading, part_num, estimated_parts, footer_text
             )
 
             size = self._calculate_embed_size(embed)
@@ -430,35 +637,22 @@ class DiscordNotifier:
 
     def _add_items_to_embed(self, embed: DiscordEmbed, items: list[DiscordMediaItem], category: str) -> None:
         """Add items to embed, splitting into multiple fields if needed with date ranges."""
-        current_chunk: list[str] = []
-        current_chunk_items: list[DiscordMediaItem] = []  # Track items for date range
-        current_chars = 0
+        formatted = [self._format_media_item(item) for item in items]
+        # Running character totals (+1 per line for the newline) let each field boundary be found by bisection
+        cumulative = list(accumulate(len(text) + 1 for text in formatted))
+        field_limit = self.MAX_FIELD_VALUE - 50
+
+        start = 0
         chunk_num = 1
+        while start < len(formatted):
+            consumed = cumulative[start - 1] if start else 0
+            # Always take at least one item so a single oversized line still gets its own field
+            end = max(bisect_right(cumulative, consumed + field_limit, lo=start), start + 1)
 
-        for item in items:
-            item_text = self._format_media_item(item)
-            item_length = len(item_text) + 1  # +1 for newline
-
-            # Check if adding this item would exceed field limit
-            if current_chars + item_length > self.MAX_FIELD_VALUE - 50 and current_chunk:
-                # Add current chunk as a field
-                field_name = self._get_date_range_field_name(current_chunk_items, chunk_num)
-                field_value = "\n".join(current_chunk)
-                embed.add_embed_field(name=field_name, value=field_value, inline=False)
-                chunk_num += 1
-                current_chunk = []
-                current_chunk_items = []
-                current_chars = 0
-
-            current_chunk.append(item_text)
-            current_chunk_items.append(item)
-            current_chars += item_length
-
-        # Add final chunk
-        if current_chunk:
-            field_name = self._get_date_range_field_name(current_chunk_items, chunk_num)
-            field_value = "\n".join(current_chunk)
-            embed.add_embed_field(name=field_name, value=field_value, inline=False)
+            field_name = self._get_date_range_field_name(items[start:end], chunk_num)
+            embed.add_embed_field(name=field_name, value="\n".join(formatted[start:end]), inline=False)
+            chunk_num += 1
+            start = end
 
     def _get_date_range_field_name(self, items: list[DiscordMediaItem], chunk_num: int) -> str:
         """Generate field name with date range in DD/MM - DD/MM format."""
@@ -469,84 +663,101 @@ class DiscordNotifier:
         first_date = items[0].get("added_at", "")
         last_date = items[-1].get("added_at", "")
 
-        # Parse ISO date format (YYYY-MM-DD) and format as DD/MM for display
-        try:
-            first_dt = datetime.strptime(first_date, "%Y-%m-%d")
-            last_dt = datetime.strptime(last_date, "%Y-%m-%d")
-            first_formatted = first_dt.strftime("%d/%m")
-            last_formatted = last_dt.strftime("%d/%m")
-
-            if first_formatted == last_formatted:
+        # Dates are ISO (YYYY-MM-DD); display them as DD/MM, formatting once when both ends match
+        first_formatted = _iso_date_to_day_month(first_date)
+        if first_formatted is not None:
+            if first_date == last_date:
                 return first_formatted
-            else:
+            last_formatted = _iso_date_to_day_month(last_date)
+            if last_formatted is not None:
+                if first_formatted == last_formatted:
+                    return first_formatted
                 return f"{first_formatted} - {last_formatted}"
-        except (ValueError, AttributeError):  # fmt: skip
-            logger.debug(
-                "Failed to parse date format '%s' or '%s' for field name, using fallback", first_date, last_date
-            )
 
+        logger.debug("Failed to parse date format '%s' or '%s' for field name, using fallback", first_date, last_date)
         return f"Items ({chunk_num})" if chunk_num > 1 else "Items"
 
+    def _dedupe_items(self, media_items: list[DiscordMediaItem]) -> list[DiscordMediaItem]:
+        """
+        Drop repeated items, keeping the first occurrence of each.
+
+        Items are identified by rating_key, or by (type, title, added_at) when there is no key.
+
+        Args:
+            media_items: Media items in their original order
+
+        Returns:
+            Media items with duplicates removed, order preserved
+        """
+        unique: dict[object, DiscordMediaItem] = {}
+        for item in media_items:
+            rating_key = item.get("rating_key")
+            key = rating_key if rating_key is not None else (item.get("type"), item.get("title"), item.get("added_at"))
+            unique.setdefault(key, item)
+
+        if len(unique) != len(media_items):
+            logger.debug("Dropped %d duplicate media items before sending", len(media_items) - len(unique))
+        return list(unique.values())
+
     def _group_items_by_type(self, media_items: list[DiscordMediaItem]) -> dict[str, list[DiscordMediaItem]]:
-        """Group media items by type."""
-        grouped: dict[str, list[DiscordMediaItem]] = {
-            "Movies": [],
-            "TV Shows": [],
-            "TV Seasons": [],
-            "TV Episodes": [],
-            "Music Albums": [],
-            "Music Tracks": [],
-            "Other": [],
-        }
+        """Group media items by type. Only categories with at least one item are present."""
+        grouped: defaultdict[str, list[DiscordMediaItem]] = defaultdict(list)
 
         for item in media_items:
-            media_type = item.get("type", "unknown")
-
-            if media_type == "movie":
-                grouped["Movies"].append(item)
-            elif media_type == "show":
-                grouped["TV Shows"].append(item)
-            elif media_type == "season":
-                grouped["TV Seasons"].append(item)
-            elif media_type == "episode":
-                grouped["TV Episodes"].append(item)
-            elif media_type == "album":
-                grouped["Music Albums"].append(item)
-            elif media_type == "track":
-                grouped["Music Tracks"].append(item)
-            else:
-                logger.warning("Unrecognized media type: %s — item placed in 'Other'", media_type)
-                grouped["Other"].append(item)
+            media_type = item.get("type")
+            category = self._TYPE_TO_CATEGORY.get(media_type) if media_type else None
+            if category is None:
+                logger.warning("Unrecognized media type: %s — item placed in 'Other'", media_type or "unknown")
+                category = "Other"
+            grouped[category].append(item)
 
-        return grouped
+        return dict(grouped)
 
     def _format_media_item(self, item: DiscordMediaItem) -> str:
         """Format a single media item for display."""
         title = item.get("title", "Unknown")
         rating_key = item.get("rating_key")
 
+        cache_key = (title, rating_key)
+        cached = self._formatted_items.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Escape only markdown characters that would alter the visible title
         safe_title = _escape_title_markdown(title)
 
-        # Create clickable link to Plex if URL and server ID are available
-        if self.plex_url and self.plex_server_id and rating_key:
-            # URL encode the library path
-            encoded_key = f"%2Flibrary%2Fmetadata%2F{rating_key}"
+        # Build the whole line in one f-string per branch (year already included in title from app.py).
+        # Create clickable link to Plex if URL and server ID are available.
+        if self._link_prefix and rating_key:
+            formatted = f"• [{safe_title}]({self._link_prefix}{rating_key})"
+        else:
+            formatted = f"• **{safe_title}**"
 
-            # Check if using Plex.tv or local Plex server
-            if "plex.tv" in self.plex_url.lower():
-                # Plex.tv format
-                link_url = f"{self.plex_url}/desktop#!/server/{self.plex_server_id}/details?key={encoded_key}"
-            else:
-                # Local Plex server format
-                link_url = f"{self.plex_url}/web/index.html#!/server/{self.plex_server_id}/details?key={encoded_key}"
+        self._formatted_items[cache_key] = formatted
+        return formatted
 
-            display_title = f"[{safe_title}]({link_url})"
-        else:
-            display_title = f"**{safe_title}**"
+    @staticmethod
+    def _header_seconds(headers: Mapping[str, str], *names: str) -> float | None:
+        """
+        Read a rate-limit delay from the first of ``names`` that holds a number of seconds.
 
-        # Format based on type (year already included in title from app.py)
-        return f"• {display_title}"
+        Header values come from Discord and must never fail a send, so malformed values are skipped.
+
+        Args:
+            headers: Response headers
+            names: Header names to try, in order
+
+        Returns:
+            Delay in seconds, or None when no header holds a valid number
+        """
+        for name in names:
+            try:
+                seconds = float(headers[name])
+            except (KeyError, TypeError, ValueError):  # fmt: skip
+                continue
+            if math.isfinite(seconds):
+                return max(0.0, seconds)
+        return None
 
     def _send_with_retry(self, webhook: DiscordWebhook, max_retries: int | None = None) -> Any:
         """
@@ -583,18 +794,29 @@ class DiscordNotifier:
                     logger.error("Discord webhook validation failed (400 Bad Request): %s", response.text)
                     return response
 
-                # If rate limited, wait and retry
+                headers = getattr(response, "headers", None) or {}
+
+                # If rate limited, wait and retry (headers are authoritative and avoid decoding the body)
                 if response.status_code == 429:
-                    retry_after = response.json().get("retry_after", 1)
+                    retry_after = self._header_seconds(headers, "Retry-After", "X-RateLimit-Reset-After")
+                    if retry_after is None:
+                        retry_after = 1.0
+                    wait_time = retry_after + random.uniform(0, self.RETRY_JITTER_SECONDS)
                     logger.warning(
-                        "Discord rate limit hit, retrying after %ss (attempt %d/%d)",
-                        retry_after,
+                        "Discord rate limit hit, retrying after %.2fs (attempt %d/%d)",
+                        wait_time,
                         attempt + 1,
                         max_retries,
                     )
-                    time.sleep(retry_after)
+                    time.sleep(wait_time)
                     continue
 
+                # Bucket drained by this request: make the next send wait for the reset up front
+                if headers.get("X-RateLimit-Remaining") == "0":
+                    reset_after = self._header_seconds(headers, "X-RateLimit-Reset-After")
+                    if reset_after:
+                        self._rate_limiter.pause(reset_after)
+
                 return response
 
             except Exception as e:
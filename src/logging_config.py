@@ -11,6 +11,9 @@ LOG_FILE = LOG_DIR / "app.log"
 LOG_MAX_BYTES = 5 * 1024 * 1024
 LOG_BACKUP_COUNT = 5
 
+# Level name -> numeric level (e.g. "DEBUG" -> 10); a plain dict lookup, unlike getattr on the logging module
+_LEVELS = logging.getLevelNamesMapping()
+
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
@@ -22,7 +25,7 @@ def setup_logging(log_level: str = "INFO") -> None:
     Args:
         log_level: Logging verbosity level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    level = getattr(logging, str(log_level).upper(), logging.INFO)
+    level = _LEVELS.get(str(log_level).upper(), logging.INFO)
 
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1,13 +1,16 @@
-"""APScheduler-based daemon scheduler with graceful SIGTERM/SIGINT shutdown handling."""
+"""CRON-driven daemon scheduler with graceful SIGTERM/SIGINT shutdown handling."""
 
 import logging
 import signal
 import sys
+import threading
+import time
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
+if TYPE_CHECKING:
+    from apscheduler.triggers.cron import CronTrigger
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +28,9 @@ class GracefulScheduler:
         """
         self.cron_schedule = cron_schedule
         self.task_func = task_func
-        self.scheduler = BlockingScheduler()
         self._shutdown_requested = False
+        # Set by the signal handler to wake the scheduling loop immediately
+        self._shutdown_event = threading.Event()
 
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._handle_shutdown)
@@ -37,8 +41,7 @@ class GracefulScheduler:
         sig_name = "SIGTERM" if signum == signal.SIGTERM else "SIGINT"
         logger.info("Received %s, initiating graceful shutdown...", sig_name)
         self._shutdown_requested = True
-        if self.scheduler.running:
-            self.scheduler.shutdown(wait=False)
+        self._shutdown_event.set()
 
     def _safe_task_wrapper(self) -> None:
         """Wrapper that catches exceptions to prevent scheduler crash."""
@@ -57,32 +60,49 @@ class GracefulScheduler:
             logger.exception("Unexpected error during scheduled task execution: %s", e)
             # Don't propagate - scheduler should continue running
 
+    def _run_loop(self, trigger: CronTrigger) -> None:
+        """
+        Sleep until each fire time of the trigger and run the task, one run at a time.
+
+        Args:
+            trigger: Parsed CRON trigger providing the fire times
+        """
+        next_run = trigger.get_next_fire_time(None, datetime.fromtimestamp(time.time(), trigger.timezone))
+
+        while next_run is not None:
+            logger.info("Next run time: %s", next_run)
+
+            # Measure the wait in POSIX seconds: subtracting datetimes that share a tzinfo ignores their UTC
+            # offsets and would be an hour off across a DST change. Event.wait returns True as soon as a
+            # shutdown signal sets the event; loop in case it wakes early
+            while (remaining := next_run.timestamp() - time.time()) > 0:
+                if self._shutdown_event.wait(timeout=remaining):
+                    return
+            if self._shutdown_requested:
+                return
+
+            self._safe_task_wrapper()
+
+            # Schedule from the current time so runs missed while the task was executing are skipped
+            after = next_run + timedelta(microseconds=1)
+            if (now := time.time()) > after.timestamp():
+                after = datetime.fromtimestamp(now, trigger.timezone)
+            next_run = trigger.get_next_fire_time(None, after)
+
     def start(self) -> None:
         """Start the scheduler and run indefinitely until shutdown signal."""
+        # Imported here so one-shot runs never pay for loading APScheduler and its timezone support
+        from apscheduler.triggers.cron import CronTrigger
+
         try:
             # Parse and validate CRON expression
             trigger = CronTrigger.from_crontab(self.cron_schedule)
             logger.info("Scheduler initialized with CRON schedule: %s", self.cron_schedule)
 
-            # Calculate next run time
-            now = datetime.now(trigger.timezone)
-            next_run = trigger.get_next_fire_time(None, now)
-            logger.info("Next run time: %s", next_run)
-
-            # Add the job to scheduler
-            self.scheduler.add_job(
-                self._safe_task_wrapper,
-                trigger=trigger,
-                id="plex_summary_task",
-                name="Plex Summary Task",
-                coalesce=True,  # Skip missed runs if previous run is still executing
-                max_instances=1,  # Only one instance at a time
-            )
-
             logger.info("🕐 Scheduler started - waiting for scheduled executions")
 
-            # Start blocking scheduler
-            self.scheduler.start()
+            # Block until shutdown (or until the schedule has no further runs)
+            self._run_loop(trigger)
 
         except ValueError as e:
             logger.error("Invalid CRON schedule '%s': %s", self.cron_schedule, e)
@@ -1,12 +1,15 @@
 """Tautulli API client for fetching Plex media library data."""
 
 import logging
+import random
 import re
 import time
-from typing import Any, Protocol, TypedDict, TypeVar, cast
+from types import TracebackType
+from typing import Any, Protocol, Self, TypedDict, TypeVar, cast
 
 import requests
-from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
 
 # Type definitions for Tautulli API responses
 
@@ -52,7 +55,9 @@ class TautulliClientProtocol(Protocol):
 class TautulliMediaItemModel(BaseModel):
     """Pydantic model for runtime validation of Tautulli media items."""
 
-    model_config = ConfigDict(extra="allow")
+    # Tautulli sends many per-item fields (thumbs, guids, summaries, ...) that nothing here reads;
+    # dropping them during validation keeps them out of every downstream dict.
+    model_config = ConfigDict(extra="ignore")
 
     # Required fields
     added_at: int
@@ -84,6 +89,9 @@ class TautulliServerIdentityModel(BaseModel):
     machine_identifier: str
 
 
+# Validates a whole list-format (older API) payload in a single pydantic-core call
+_MEDIA_ITEM_LIST_ADAPTER = TypeAdapter(list[TautulliMediaItemModel])
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,6 +102,12 @@ class TautulliClient:
     DEFAULT_TIMEOUT = 10  # seconds
     DEFAULT_MAX_RETRIES = 3
     RETRY_BACKOFF_BASE = 2  # Exponential backoff base (1s, 2s, 4s, ...)
+    RETRY_BACKOFF_MAX = 30  # Cap on the un-jittered backoff, in seconds
+    RETRY_JITTER = 0.5  # Up to +50% random extra wait so concurrent clients don't retry in lockstep
+    REQUEST_DEADLINE = 60  # seconds; no retry is scheduled past this point, whatever max_retries says
+    # 4xx responses that can succeed on a later attempt; any other 4xx is a permanent (config) error
+    RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+    IDENTITY_TTL = 3600  # seconds; the Plex machine identifier practically never changes
     APIKEY_PATTERN = re.compile(r"(apikey=)[^&\s]+", re.IGNORECASE)
 
     def __init__(self, base_url: str, api_key: str):
@@ -107,6 +121,36 @@ class TautulliClient:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
 
+        # Endpoint and auth parameter are the same for every command
+        self._api_url = f"{self.base_url}/api/v2"
+        self._base_params: dict[str, Any] = {"apikey": api_key}
+
+        # One pooled session so repeated calls reuse the keep-alive connection to Tautulli.
+        # Retries are handled by _request, so the adapter itself never retries.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Accept": "application/json"})
+
+        # (monotonic fetch time, identity) from the last successful get_server_identity call
+        self._identity_cache: tuple[float, TautulliServerIdentity] | None = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def _sanitize_error(self, error: Exception) -> str:
         """
         Sanitize exception text to avoid leaking credentials.
@@ -118,9 +162,12 @@ class TautulliClient:
             Redacted exception message
         """
         message = str(error)
-        if self.api_key:
+        # Cheap substring checks first; most error messages contain neither the key nor an apikey= parameter
+        if self.api_key and self.api_key in message:
             message = message.replace(self.api_key, "***")
-        return self.APIKEY_PATTERN.sub(r"\1***", message)
+        if "apikey=" in message.lower():
+            message = self.APIKEY_PATTERN.sub(r"\1***", message)
+        return message
 
     def _sanitize_exception(self, error: Exception) -> Exception:
         """
@@ -152,16 +199,26 @@ class TautulliClient:
         try:
             return model.model_validate(data)
         except ValidationError as e:
-            # Extract a concise error message
-            errors = e.errors()
-            error_details = "; ".join(
-                [
-                    f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}" if err["loc"] else err["msg"]
-                    for err in errors
-                ]
-            )
-            sanitized_msg = self._sanitize_error(Exception(error_details))
-            raise RuntimeError(f"Tautulli response validation failed: {sanitized_msg}") from None
+            raise self._validation_failure(e) from None
+
+    def _validation_failure(self, error: ValidationError) -> RuntimeError:
+        """
+        Summarize a Pydantic validation error as a concise, sanitized RuntimeError.
+
+        Args:
+            error: Validation error raised for a Tautulli response
+
+        Returns:
+            RuntimeError describing each failing field location
+        """
+        error_details = "; ".join(
+            [
+                f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}" if err["loc"] else err["msg"]
+                for err in error.errors()
+            ]
+        )
+        sanitized_msg = self._sanitize_error(Exception(error_details))
+        return RuntimeError(f"Tautulli response validation failed: {sanitized_msg}")
 
     def _request(self, cmd: str, max_retries: int | None = None, **params: Any) -> dict[str, object] | list[object]:
         """
@@ -169,7 +226,8 @@ class TautulliClient:
 
         Args:
             cmd: Tautulli API command to execute
-            max_retries: Maximum number of retry attempts (default: DEFAULT_MAX_RETRIES)
+            max_retries: Maximum number of retry attempts (default: DEFAULT_MAX_RETRIES); retrying
+                also stops once the next attempt would start after REQUEST_DEADLINE seconds
             **params: Additional query parameters for the API request
 
         Returns:
@@ -177,24 +235,20 @@ class TautulliClient:
             Tautulli API versions where ``response['data']`` is returned as a bare list)
 
         Raises:
-            requests.RequestException: If request fails after all retries
+            requests.RequestException: If request fails after all retries, or at once on a non-retryable 4xx
             RuntimeError: If Tautulli returns unsuccessful response
         """
         if max_retries is None:
             max_retries = self.DEFAULT_MAX_RETRIES
 
-        url = f"{self.base_url}/api/v2"
-        query = {
-            "apikey": self.api_key,
-            "cmd": cmd,
-            **params,
-        }
+        query = {**self._base_params, "cmd": cmd, **params}
         logger.debug("Requesting Tautulli: %s", cmd)
 
+        deadline = time.monotonic() + self.REQUEST_DEADLINE
         last_exception: Exception = RuntimeError("No attempts made")
         for attempt in range(max_retries):
             try:
-                resp = requests.get(url, params=query, timeout=self.DEFAULT_TIMEOUT)
+                resp = self._session.get(self._api_url, params=query, timeout=self.DEFAULT_TIMEOUT)
                 resp.raise_for_status()
 
                 data = cast(dict[str, object], resp.json())
@@ -208,10 +262,29 @@ class TautulliClient:
             except (requests.RequestException, RuntimeError) as e:
                 last_exception = e
                 safe_error = self._sanitize_error(e)
+                http_response = e.response if isinstance(e, requests.HTTPError) else None
+                status = http_response.status_code if http_response is not None else None
+                if status is not None and status < 500 and status not in self.RETRYABLE_CLIENT_STATUSES:
+                    # Bad API key, unknown endpoint, ...: retrying cannot help
+                    logger.error("Request failed for cmd=%s with non-retryable HTTP %d: %s", cmd, status, safe_error)
+                    break
                 if attempt < max_retries - 1:
-                    wait_time = self.RETRY_BACKOFF_BASE**attempt  # Exponential backoff: 1s, 2s, 4s
+                    # Exponential backoff (1s, 2s, 4s, ... capped), stretched by random jitter
+                    backoff = min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF_BASE**attempt)
+                    wait_time = backoff * (1 + random.uniform(0, self.RETRY_JITTER))
+                    if status == 429:
+                        wait_time = max(wait_time, self._retry_after_seconds(http_response))
+                    if time.monotonic() + wait_time >= deadline:
+                        logger.error(
+                            "Request failed for cmd=%s after %d attempts, next retry would pass the %ds deadline: %s",
+                            cmd,
+                            attempt + 1,
+                            self.REQUEST_DEADLINE,
+                            safe_error,
+                        )
+                        break
                     logger.warning(
-                        "Request failed for cmd=%s (attempt %d/%d): %s. Retrying in %ds...",
+                        "Request failed for cmd=%s (attempt %d/%d): %s. Retrying in %.2fs...",
                         cmd,
                         attempt + 1,
                         max_retries,
@@ -224,6 +297,24 @@ class TautulliClient:
 
         raise self._sanitize_exception(last_exception) from None
 
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response | None) -> float:
+        """
+        Read the delay requested by a ``Retry-After`` header.
+
+        Args:
+            response: HTTP response that may carry the header
+
+        Returns:
+            Delay in seconds, or 0 when the header is missing or not a number of seconds
+        """
+        if response is None:
+            return 0.0
+        try:
+            return max(0.0, float(response.headers.get("Retry-After", 0)))
+        except (TypeError, ValueError):  # fmt: skip
+            return 0.0
+
     def get_recently_added(self, days: int = 7, count: int = 100) -> TautulliRecentlyAddedPayload:
         """
         Get recently added items from Tautulli.
@@ -253,12 +344,12 @@ class TautulliClient:
             validated = self._validate_response(response_payload, TautulliRecentlyAddedModel)
             return cast(TautulliRecentlyAddedPayload, validated.model_dump())
         elif isinstance(response_payload, list):
-            # List format (older API)
-            validated_items = [
-                self._validate_response(cast(dict[str, object], item), TautulliMediaItemModel)
-                for item in response_payload
-            ]
-            return cast(TautulliRecentlyAddedPayload, [item.model_dump() for item in validated_items])
+            # List format (older API): validate and dump all items in one pass each, not one call per item
+            try:
+                validated_items = _MEDIA_ITEM_LIST_ADAPTER.validate_python(response_payload)
+            except ValidationError as e:
+                raise self._validation_failure(e) from None
+            return cast(TautulliRecentlyAddedPayload, _MEDIA_ITEM_LIST_ADAPTER.dump_python(validated_items))
         else:
             raise RuntimeError(f"Unexpected response format: {type(response_payload).__name__}")
 
@@ -266,9 +357,18 @@ class TautulliClient:
         """
         Get Plex server identity information including machine identifier.
 
+        The result is cached on the client for ``IDENTITY_TTL`` seconds, so repeated
+        calls do not hit the network.
+
         Returns:
             Dict with server info including 'machine_identifier'
         """
+        if self._identity_cache is not None:
+            fetched_at, identity = self._identity_cache
+            if time.monotonic() - fetched_at < self.IDENTITY_TTL:
+                logger.debug("Using cached Plex server identity")
+                return cast(TautulliServerIdentity, dict(identity))
+
         logger.debug("Requesting Plex server identity")
         response_payload = self._request("get_server_identity")
         if not isinstance(response_payload, dict):
@@ -276,4 +376,10 @@ class TautulliClient:
                 f"Unexpected response format for get_server_identity: expected dict, got {type(response_payload).__name__}"
             )
         validated = self._validate_response(response_payload, TautulliServerIdentityModel)
-        return cast(TautulliServerIdentity, validated.model_dump())
+        identity = cast(TautulliServerIdentity, validated.model_dump())
+        self._identity_cache = (time.monotonic(), identity)
+        return cast(TautulliServerIdentity, dict(identity))
+
+    def invalidate_identity(self) -> None:
+        """Drop the cached server identity so the next call refetches it."""
+        self._identity_cache = None
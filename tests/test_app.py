@@ -2,6 +2,7 @@
 
 import importlib.metadata
 import logging
+from contextlib import nullcontext
 from datetime import UTC, datetime
 from typing import cast
 
@@ -19,269 +20,211 @@ from src.app import (
     run_summary,
 )
 from src.config import Config
-from src.tautulli_client import TautulliClient, TautulliMediaItem
+from src.tautulli_client import TautulliClient, TautulliMediaItem, TautulliMediaItemModel
 
+# Test items are stamped "now" as of test collection: well inside any days_back window, without a clock call per item
+_RECENT_TIMESTAMP = int(datetime.now(UTC).timestamp())
 
-class TestCalculateBatchParams:
-    """Tests for _calculate_batch_params function."""
-
-    @pytest.mark.unit
-    def test_batch_params_7_days(self):
-        """Test batch parameters for the <= 7 days boundary."""
-        initial, increment = _calculate_batch_params(7)
-        assert initial == 100
-        assert increment == 100
-
-    @pytest.mark.unit
-    def test_batch_params_30_days(self):
-        """Test batch parameters for the <= 30 days boundary."""
-        initial, increment = _calculate_batch_params(30)
-        assert initial == 200
-        assert increment == 200
-
-    @pytest.mark.unit
-    def test_batch_params_over_30_days(self):
-        """Test batch parameters for more than 30 days."""
-        initial, increment = _calculate_batch_params(31)
-        assert initial == 500
-        assert increment == 500
-
-    @pytest.mark.unit
-    def test_batch_params_with_override(self):
-        """Test that override parameter takes precedence over the days-based logic."""
-        initial, increment = _calculate_batch_params(7, override=1000)
-        assert initial == 1000
-        assert increment == 1000
-
-
-class TestFormatDisplayTitle:
-    """Tests for _format_display_title function."""
-
-    @pytest.mark.unit
-    def test_format_episode_with_valid_numbers(self):
-        """Test formatting episode with valid season/episode numbers."""
-        item: TautulliMediaItem = {
-            "media_type": "episode",
-            "grandparent_title": "Breaking Bad",
-            "parent_media_index": "5",
-            "media_index": "14",
-            "title": "Ozymandias",
-        }
-        result = _format_display_title(item)
-        assert result == "Breaking Bad - S05E14 - Ozymandias"
-
-    @pytest.mark.unit
-    def test_format_episode_with_integer_numbers(self):
-        """Test formatting episode with integer season/episode numbers."""
-        item: TautulliMediaItem = {
-            "media_type": "episode",
-            "grandparent_title": "The Wire",
-            "parent_media_index": 1,
-            "media_index": 1,
-            "title": "The Target",
-        }
-        result = _format_display_title(item)
-        assert result == "The Wire - S01E01 - The Target"
-
-    @pytest.mark.unit
-    def test_format_episode_with_missing_numbers(self):
-        """Test formatting episode with missing season/episode numbers."""
-        item: TautulliMediaItem = {
-            "media_type": "episode",
-            "grandparent_title": "Unknown Show",
-            "parent_media_index": "?",
-            "media_index": "?",
-            "title": "Episode Title",
-        }
-        result = _format_display_title(item)
-        assert result == "Unknown Show - S00E00 - Episode Title"
-
-    @pytest.mark.unit
-    def test_format_episode_with_invalid_numbers(self):
-        """Test formatting episode with non-numeric season/episode values."""
-        item: TautulliMediaItem = {
-            "media_type": "episode",
-            "grandparent_title": "Show Name",
-            "parent_media_index": "invalid",
-            "media_index": "abc",
-            "title": "Episode",
-        }
-        result = _format_display_title(item)
-        assert result == "Show Name - SinvalidEabc - Episode"
-
-    @pytest.mark.unit
-    def test_format_episode_missing_fields(self):
-        """Test formatting episode with missing fields."""
-        item: TautulliMediaItem = {
-            "media_type": "episode",
-            # Missing grandparent_title, parent_media_index, etc.
-        }
-        result = _format_display_title(item)
-        assert "Unknown Show" in result
-        assert "Unknown Episode" in result
-
-    @pytest.mark.unit
-    def test_format_season(self):
-        """Test formatting season."""
-        item: TautulliMediaItem = {"media_type": "season", "parent_title": "The Sopranos", "media_index": "3"}
-        result = _format_display_title(item)
-        assert result == "The Sopranos - Season 3"
-
-    @pytest.mark.unit
-    def test_format_season_missing_fields(self):
-        """Test formatting season with missing fields."""
-        item: TautulliMediaItem = {"media_type": "season", "media_index": "1"}
-        result = _format_display_title(item)
-        assert "Unknown Show" in result
-        assert "Season 1" in result
-
-    @pytest.mark.unit
-    def test_format_show_with_year(self):
-        """Test formatting show with year."""
-        item: TautulliMediaItem = {"media_type": "show", "title": "Stranger Things", "year": "2016"}
-        result = _format_display_title(item)
-        assert result == "Stranger Things (2016)"
-
-    @pytest.mark.unit
-    def test_format_show_without_year(self):
-        """Test formatting show without year."""
-        item: TautulliMediaItem = {"media_type": "show", "title": "New Show"}
-        result = _format_display_title(item)
-        assert result == "New Show (New Series)"
 
-    @pytest.mark.unit
-    def test_format_track(self):
-        """Test formatting music track."""
-        item: TautulliMediaItem = {
-            "media_type": "track",
-            "grandparent_title": "The Beatles",
-            "parent_title": "Abbey Road",
-            "title": "Come Together",
-        }
-        result = _format_display_title(item)
-        assert result == "The Beatles - Abbey Road - Come Together"
+def _recent_items(count: int, media_type: str = "movie", label: str = "Movie") -> list[TautulliMediaItem]:
+    """Build `count` items added just now, titled '<label> 1'..'<label> count'."""
+    return [
+        {"media_type": media_type, "title": f"{label} {i}", "added_at": _RECENT_TIMESTAMP} for i in range(1, count + 1)
+    ]
 
-    @pytest.mark.unit
-    def test_format_track_missing_fields(self):
-        """Test formatting track with missing fields."""
-        item: TautulliMediaItem = {"media_type": "track", "title": "Song Name"}
-        result = _format_display_title(item)
-        assert "Unknown Artist" in result
-        assert "Unknown Album" in result
-        assert "Song Name" in result
 
-    @pytest.mark.unit
-    def test_format_album(self):
-        """Test formatting music album."""
-        item: TautulliMediaItem = {
-            "media_type": "album",
-            "parent_title": "Pink Floyd",
-            "title": "Dark Side of the Moon",
-        }
-        result = _format_display_title(item)
-        assert result == "Pink Floyd - Dark Side of the Moon"
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Skip the pause _fetch_items takes between batches, so no test in this module ever really waits."""
+    monkeypatch.setattr("src.app.time.sleep", lambda _seconds: None)
 
-    @pytest.mark.unit
-    def test_format_album_missing_fields(self):
-        """Test formatting album with missing fields."""
-        item: TautulliMediaItem = {"media_type": "album", "title": "Album Name"}
-        result = _format_display_title(item)
-        assert "Unknown Artist" in result
-        assert "Album Name" in result
 
-    @pytest.mark.unit
-    def test_format_movie_with_year(self):
-        """Test formatting movie with year."""
-        item: TautulliMediaItem = {"media_type": "movie", "title": "The Shawshank Redemption", "year": "1994"}
-        result = _format_display_title(item)
-        assert result == "The Shawshank Redemption (1994)"
+class TestCalculateBatchParams:
+    """Tests for _calculate_batch_params function."""
 
     @pytest.mark.unit
-    def test_format_movie_without_year(self):
-        """Test formatting movie without year."""
-        item: TautulliMediaItem = {"media_type": "movie", "title": "New Movie"}
-        result = _format_display_title(item)
-        assert result == "New Movie"
+    @pytest.mark.parametrize(
+        ("days", "expected"),
+        [(1, (100, 100)), (7, (100, 100)), (8, (200, 200)), (30, (200, 200)), (31, (500, 500)), (365, (500, 500))],
+    )
+    def test_batch_params_by_days(self, days, expected):
+        """Test batch parameters on each side of the 7 and 30 day boundaries."""
+        assert _calculate_batch_params(days) == expected
 
     @pytest.mark.unit
-    def test_format_movie_missing_fields(self):
-        """Test formatting movie with missing fields."""
-        item: TautulliMediaItem = {"media_type": "movie"}
-        result = _format_display_title(item)
-        assert result == "Unknown Movie"
+    @pytest.mark.parametrize("days", [7, 90])
+    def test_batch_params_with_override(self, days):
+        """Test that override parameter takes precedence over the days-based logic."""
+        assert _calculate_batch_params(days, override=1000) == (1000, 1000)
 
-    @pytest.mark.unit
-    def test_format_unknown_media_type(self):
-        """Test formatting unknown media type."""
-        item: TautulliMediaItem = {"media_type": "unknown_type", "title": "Some Media"}
-        result = _format_display_title(item)
-        assert result == "Some Media"
 
-    @pytest.mark.unit
-    def test_format_no_media_type(self):
-        """Test formatting when media_type is missing."""
-        item: TautulliMediaItem = {"title": "Some Title"}
-        result = _format_display_title(item)
-        assert result == "Some Title"
+class TestFormatDisplayTitle:
+    """Tests for _format_display_title function."""
 
     @pytest.mark.unit
-    def test_format_unknown_type_without_title(self):
-        """Test that the else-branch returns 'Unknown' when no title is present."""
-        item: TautulliMediaItem = {"media_type": "unknown"}
+    @pytest.mark.parametrize(
+        ("item", "expected"),
+        [
+            pytest.param(
+                {
+                    "media_type": "episode",
+                    "grandparent_title": "Breaking Bad",
+                    "parent_media_index": "5",
+                    "media_index": "14",
+                    "title": "Ozymandias",
+                },
+                "Breaking Bad - S05E14 - Ozymandias",
+                id="episode-valid-numbers",
+            ),
+            pytest.param(
+                {
+                    "media_type": "episode",
+                    "grandparent_title": "The Wire",
+                    "parent_media_index": 1,
+                    "media_index": 1,
+                    "title": "The Target",
+                },
+                "The Wire - S01E01 - The Target",
+                id="episode-integer-numbers",
+            ),
+            pytest.param(
+                {
+                    "media_type": "episode",
+                    "grandparent_title": "Unknown Show",
+                    "parent_media_index": "?",
+                    "media_index": "?",
+                    "title": "Episode Title",
+                },
+                "Unknown Show - S00E00 - Episode Title",
+                id="episode-missing-numbers",
+            ),
+            pytest.param(
+                {
+                    "media_type": "episode",
+                    "grandparent_title": "Show Name",
+                    "parent_media_index": "invalid",
+                    "media_index": "abc",
+                    "title": "Episode",
+                },
+                "Show Name - SinvalidEabc - Episode",
+                id="episode-invalid-numbers",
+            ),
+            pytest.param(
+                {
+                    "media_type": "episode",
+                    "grandparent_title": "Show Name",
+                    "parent_media_index": "2",
+                    "media_index": "x",
+                    "title": "Episode",
+                },
+                "Show Name - S2Ex - Episode",
+                id="episode-one-invalid-number-keeps-both-raw",
+            ),
+            pytest.param(
+                {"media_type": "episode"}, "Unknown Show - S00E00 - Unknown Episode", id="episode-missing-fields"
+            ),
+            pytest.param(
+                {"media_type": "season", "parent_title": "The Sopranos", "media_index": "3"},
+                "The Sopranos - Season 3",
+                id="season",
+            ),
+            pytest.param(
+                {"media_type": "season", "parent_title": "Doctor Who", "media_index": 0},
+                "Doctor Who - Season 0",
+                id="season-zero-is-kept",
+            ),
+            pytest.param(
+                {"media_type": "season", "media_index": "1"}, "Unknown Show - Season 1", id="season-missing-fields"
+            ),
+            pytest.param(
+                {"media_type": "show", "title": "Stranger Things", "year": "2016"},
+                "Stranger Things (2016)",
+                id="show-with-year",
+            ),
+            pytest.param({"media_type": "show", "title": "New Show"}, "New Show (New Series)", id="show-without-year"),
+            pytest.param(
+                {
+                    "media_type": "track",
+                    "grandparent_title": "The Beatles",
+                    "parent_title": "Abbey Road",
+                    "title": "Come Together",
+                },
+                "The Beatles - Abbey Road - Come Together",
+                id="track",
+            ),
+            pytest.param(
+                {"media_type": "track", "title": "Song Name"},
+                "Unknown Artist - Unknown Album - Song Name",
+                id="track-missing-fields",
+            ),
+            pytest.param(
+                {"media_type": "album", "parent_title": "Pink Floyd", "title": "Dark Side of the Moon"},
+                "Pink Floyd - Dark Side of the Moon",
+                id="album",
+            ),
+            pytest.param(
+                {"media_type": "album", "title": "Album Name"}, "Unknown Artist - Album Name", id="album-missing-fields"
+            ),
+            pytest.param(
+                {"media_type": "movie", "title": "The Shawshank Redemption", "year": "1994"},
+                "The Shawshank Redemption (1994)",
+                id="movie-with-year",
+            ),
+            pytest.param({"media_type": "movie", "title": "New Movie"}, "New Movie", id="movie-without-year"),
+            pytest.param({"media_type": "movie"}, "Unknown Movie", id="movie-missing-fields"),
+            pytest.param({"media_type": "unknown_type", "title": "Some Media"}, "Some Media", id="unknown-media-type"),
+            pytest.param({"title": "Some Title"}, "Some Title", id="no-media-type"),
+            pytest.param({"media_type": "unknown"}, "Unknown", id="unknown-type-without-title"),
+        ],
+    )
+    def test_format_display_title(self, item, expected):
+        """Each media type should render its documented title layout, with fallbacks for missing fields."""
+        assert _format_display_title(item) == expected
+
+    @pytest.mark.unit
+    def test_format_episode_from_validated_item_with_null_fields(self):
+        """Optional fields dumped as None by the Tautulli model should fall back like missing ones."""
+        item = cast(
+            TautulliMediaItem,
+            TautulliMediaItemModel.model_validate({"added_at": 1, "media_type": "episode", "title": ""}).model_dump(),
+        )
         result = _format_display_title(item)
-        assert result == "Unknown"
+        assert result == "Unknown Show - S00E00 - Unknown Episode"
 
 
 class TestRunSummary:
     """Tests for run_summary behavior and operational guarantees."""
 
-    @pytest.mark.unit
-    def test_run_summary_fails_in_run_once_when_discord_send_fails(self, monkeypatch):
-        """Discord delivery errors should produce non-zero exit code in one-shot mode."""
-
-        class StubTautulliClient:
-            def get_recently_added(self, days, count):
-                timestamp = int(datetime.now(UTC).timestamp())
-                return {"recently_added": [{"media_type": "movie", "title": "Movie", "added_at": timestamp}]}
-
-            def get_server_identity(self):
-                return {"machine_identifier": "server-id"}
-
-        class StubDiscordNotifier:
-            def __init__(self, webhook_url, plex_url, plex_server_id):
-                self.webhook_url = webhook_url
-                self.plex_url = plex_url
-                self.plex_server_id = plex_server_id
-
-            def send_summary(self, media_items, days_back, total_count):
-                raise requests.RequestException("network timeout")
-
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
-        monkeypatch.setattr("src.app.DiscordNotifier", StubDiscordNotifier)
-
-        config = Config.model_validate(
+    @staticmethod
+    def _config(**overrides):
+        """Build a one-shot Config without Discord, with selected fields overridden."""
+        return Config.model_validate(
             {
                 "tautulli_url": "http://tautulli:8181",
                 "tautulli_api_key": "secret",
                 "run_once": True,
-                "discord_webhook_url": "https://discord.example/webhook",
+                "discord_webhook_url": None,
+                **overrides,
             }
         )
 
-        assert run_summary(config) == 1
-
-    @pytest.mark.unit
-    def test_run_summary_keeps_scheduled_mode_non_fatal_on_discord_error(self, monkeypatch):
-        """Discord errors should not fail scheduled executions."""
+    @staticmethod
+    def _patch_tautulli(monkeypatch, get_recently_added):
+        """Make run_summary's TautulliClient return get_recently_added(days, count) as its payload."""
 
         class StubTautulliClient:
             def get_recently_added(self, days, count):
-                timestamp = int(datetime.now(UTC).timestamp())
-                return {"recently_added": [{"media_type": "movie", "title": "Movie", "added_at": timestamp}]}
+                return get_recently_added(days, count)
 
             def get_server_identity(self):
                 return {"machine_identifier": "server-id"}
 
+        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: nullcontext(StubTautulliClient()))
+
+    @pytest.fixture
+    def failing_discord(self, monkeypatch):
+        """Patch run_summary's collaborators: one recent movie from Tautulli, and a Discord send that fails."""
+
         class StubDiscordNotifier:
             def __init__(self, webhook_url, plex_url, plex_server_id):
                 self.webhook_url = webhook_url
@@ -291,44 +234,33 @@ class TestRunSummary:
             def send_summary(self, media_items, days_back, total_count):
                 raise requests.RequestException("network timeout")
 
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
+        self._patch_tautulli(monkeypatch, lambda days, count: {"recently_added": _recent_items(1)})
         monkeypatch.setattr("src.app.DiscordNotifier", StubDiscordNotifier)
 
-        config = Config.model_validate(
-            {
-                "tautulli_url": "http://tautulli:8181",
-                "tautulli_api_key": "secret",
-                "run_once": False,
-                "discord_webhook_url": "https://discord.example/webhook",
-            }
-        )
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("failing_discord")
+    def test_run_summary_fails_in_run_once_when_discord_send_fails(self):
+        """Discord delivery errors should produce non-zero exit code in one-shot mode."""
+        config = self._config(discord_webhook_url="https://discord.example/webhook")
+
+        assert run_summary(config) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("failing_discord")
+    def test_run_summary_keeps_scheduled_mode_non_fatal_on_discord_error(self):
+        """Discord errors should not fail scheduled executions."""
+        config = self._config(run_once=False, discord_webhook_url="https://discord.example/webhook")
 
         assert run_summary(config) == 0
 
     @pytest.mark.unit
     def test_run_summary_limits_info_output_per_media_type(self, monkeypatch, caplog):
         """INFO logging should show at most 10 entries per media type."""
+        items = _recent_items(12) + _recent_items(11, media_type="show", label="Show")
+        self._patch_tautulli(monkeypatch, lambda days, count: {"recently_added": items})
 
-        class StubTautulliClient:
-            def get_recently_added(self, days, count):
-                timestamp = int(datetime.now(UTC).timestamp())
-                movies = [{"media_type": "movie", "title": f"Movie {i}", "added_at": timestamp} for i in range(1, 13)]
-                shows = [{"media_type": "show", "title": f"Show {i}", "added_at": timestamp} for i in range(1, 12)]
-                return {"recently_added": movies + shows}
-
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
-
-        config = Config.model_validate(
-            {
-                "tautulli_url": "http://tautulli:8181",
-                "tautulli_api_key": "secret",
-                "run_once": True,
-                "discord_webhook_url": None,
-            }
-        )
-
-        caplog.set_level("INFO")
-        assert run_summary(config) == 0
+        caplog.set_level("INFO", logger="app")
+        assert run_summary(self._config()) == 0
 
         added_lines = [record.message for record in caplog.records if record.message.startswith("➕")]
         assert len(added_lines) == 20
@@ -339,30 +271,15 @@ class TestRunSummary:
         """Fetching should stop when the API returns fewer items than requested (hit its limit)."""
         call_counts = {"n": 0}
 
-        class StubTautulliClient:
-            def get_recently_added(self, days, count):
-                call_counts["n"] += 1
-                timestamp = int(datetime.now(UTC).timestamp())
-                # Always return 5 items regardless of how many were requested
-                return {
-                    "recently_added": [
-                        {"media_type": "movie", "title": f"Movie {i}", "added_at": timestamp} for i in range(5)
-                    ]
-                }
-
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
+        def get_recently_added(days, count):
+            call_counts["n"] += 1
+            # Always return 5 items regardless of how many were requested
+            return {"recently_added": _recent_items(5)}
 
-        config = Config.model_validate(
-            {
-                "tautulli_url": "http://tautulli:8181",
-                "tautulli_api_key": "secret",
-                "run_once": True,
-                "discord_webhook_url": None,
-                "initial_batch_size": 100,  # request 100, get 5 → stop after first batch
-            }
-        )
+        self._patch_tautulli(monkeypatch, get_recently_added)
 
-        assert run_summary(config) == 0
+        # request 100, get 5 → stop after first batch
+        assert run_summary(self._config(initial_batch_size=100)) == 0
         assert call_counts["n"] == 1  # exactly one API call
 
     @pytest.mark.unit
@@ -371,97 +288,51 @@ class TestRunSummary:
         call_counts = {"n": 0}
         timestamps = {
             # First batch: all items are recent (within range), oldest still in range → expand
-            1: int(datetime.now(UTC).timestamp()),
+            1: _RECENT_TIMESTAMP,
             # Second batch: oldest item is old (outside range) → stop
             2: 0,
         }
 
-        class StubTautulliClient:
-            def get_recently_added(self, days, count):
-                call_counts["n"] += 1
-                oldest_ts = timestamps.get(call_counts["n"], 0)
-                items = [
-                    {"media_type": "movie", "title": f"Movie {i}", "added_at": int(datetime.now(UTC).timestamp())}
-                    for i in range(count - 1)
-                ]
-                # Last item has the controlled timestamp
-                items.append({"media_type": "movie", "title": "Oldest", "added_at": oldest_ts})
-                return {"recently_added": items}
-
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
-        monkeypatch.setattr("src.app.time.sleep", lambda _: None)
+        def get_recently_added(days, count):
+            call_counts["n"] += 1
+            oldest_ts = timestamps.get(call_counts["n"], 0)
+            items = _recent_items(count - 1)
+            # Last item has the controlled timestamp
+            items.append({"media_type": "movie", "title": "Oldest", "added_at": oldest_ts})
+            return {"recently_added": items}
 
-        config = Config.model_validate(
-            {
-                "tautulli_url": "http://tautulli:8181",
-                "tautulli_api_key": "secret",
-                "run_once": True,
-                "discord_webhook_url": None,
-                "initial_batch_size": 5,
-            }
-        )
+        self._patch_tautulli(monkeypatch, get_recently_added)
 
-        assert run_summary(config) == 0
+        assert run_summary(self._config(initial_batch_size=5)) == 0
         assert call_counts["n"] == 2  # expanded once, then stopped
 
     @pytest.mark.unit
     def test_run_summary_stops_at_max_iterations(self, monkeypatch, caplog):
         """Fetching should stop and warn when the max iteration guardrail (50) is reached."""
+        # Always return exactly `count` items, all recent → always triggers another iteration
+        self._patch_tautulli(monkeypatch, lambda days, count: {"recently_added": _recent_items(count)})
 
-        class StubTautulliClient:
-            def get_recently_added(self, days, count):
-                # Always return exactly `count` items, all recent → always triggers another iteration
-                timestamp = int(datetime.now(UTC).timestamp())
-                return {
-                    "recently_added": [
-                        {"media_type": "movie", "title": f"Movie {i}", "added_at": timestamp} for i in range(count)
-                    ]
-                }
-
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
-        monkeypatch.setattr("src.app.time.sleep", lambda _: None)
-
-        config = Config.model_validate(
-            {
-                "tautulli_url": "http://tautulli:8181",
-                "tautulli_api_key": "secret",
-                "run_once": True,
-                "discord_webhook_url": None,
-                "initial_batch_size": 1,
-            }
-        )
-
-        caplog.set_level("WARNING")
-        assert run_summary(config) == 0
+        caplog.set_level("WARNING", logger="app")
+        assert run_summary(self._config(initial_batch_size=1)) == 0
         assert any("max fetch iterations" in r.message.lower() for r in caplog.records)
 
     @pytest.mark.unit
-    def test_run_summary_stops_when_max_fetch_count_reached(self, monkeypatch):
+    def test_run_summary_stops_when_max_fetch_count_reached(self, monkeypatch, caplog):
         """Iterative fetching should stop once the max fetch count guardrail is reached."""
+        requested: list[int] = []
 
-        class StubTautulliClient:
-            def get_recently_added(self, days, count):
-                timestamp = int(datetime.now(UTC).timestamp())
-                return {
-                    "recently_added": [
-                        {"media_type": "movie", "title": f"Movie {i}", "added_at": timestamp} for i in range(count)
-                    ]
-                }
-
-        monkeypatch.setattr("src.app.TautulliClient", lambda *args, **kwargs: StubTautulliClient())
-        monkeypatch.setattr("src.app.time.sleep", lambda _seconds: None)
+        def get_recently_added(days, count):
+            requested.append(count)
+            return {"recently_added": _recent_items(count)}
 
-        config = Config.model_validate(
-            {
-                "tautulli_url": "http://tautulli:8181",
-                "tautulli_api_key": "secret",
-                "run_once": True,
-                "discord_webhook_url": None,
-                "initial_batch_size": 9990,
-            }
-        )
+        self._patch_tautulli(monkeypatch, get_recently_added)
+        # Shrink the guardrail so the test exercises it with dozens of items rather than ~10k
+        monkeypatch.setattr("src.app.MAX_FETCH_COUNT", 50)
 
-        assert run_summary(config) == 0
+        caplog.set_level("WARNING", logger="app")
+        assert run_summary(self._config(initial_batch_size=45)) == 0
+        assert requested == [45]  # 45 + 45 would exceed the cap, so no second batch
+        assert any("max fetch count" in r.message.lower() for r in caplog.records)
 
 
 class TestMain:
@@ -532,19 +403,12 @@ class TestBuildDiscordPayloadDebugPath:
         """When the app logger is at DEBUG level, each item should be debug-logged."""
         from src.app import _build_discord_payload
 
-        timestamp = int(datetime.now(UTC).timestamp())
         items: list[TautulliMediaItem] = [
-            {"media_type": "movie", "title": "Movie X", "added_at": timestamp},
+            {"media_type": "movie", "title": "Movie X", "added_at": _RECENT_TIMESTAMP},
         ]
-        # Enable DEBUG on the 'app' logger so debug_enabled = True inside _build_discord_payload
-        app_logger = logging.getLogger("app")
-        orig = app_logger.level
-        app_logger.setLevel(logging.DEBUG)
+        # caplog sets the 'app' logger itself to DEBUG (restored at teardown) so debug_enabled is True
         caplog.set_level(logging.DEBUG, logger="app")
-        try:
-            result = _build_discord_payload(items)
-        finally:
-            app_logger.setLevel(orig)
+        result = _build_discord_payload(items)
 
         assert len(result) == 1
         debug_msgs = [r.message for r in caplog.records if r.levelno == logging.DEBUG and "Movie X" in r.message]
@@ -555,9 +419,8 @@ class TestBuildDiscordPayloadDebugPath:
         """Items with rating_key should have it transferred to the DiscordMediaItem."""
         from src.app import _build_discord_payload
 
-        timestamp = int(datetime.now(UTC).timestamp())
         items: list[TautulliMediaItem] = [
-            {"media_type": "movie", "title": "Movie With Key", "added_at": timestamp, "rating_key": 42},
+            {"media_type": "movie", "title": "Movie With Key", "added_at": _RECENT_TIMESTAMP, "rating_key": 42},
         ]
         result = _build_discord_payload(items)
         assert len(result) == 1
@@ -588,11 +451,10 @@ class TestFetchItemsEdgeCases:
     @pytest.mark.unit
     def test_list_format_response_is_handled(self):
         """Older Tautulli API returning a bare list should be filtered and returned."""
-        timestamp = int(datetime.now(UTC).timestamp())
 
         class StubTautulli:
             def get_recently_added(self, days, count):
-                return [{"media_type": "movie", "title": "Movie A", "added_at": timestamp}]
+                return [{"media_type": "movie", "title": "Movie A", "added_at": _RECENT_TIMESTAMP}]
 
         result = _fetch_items(cast(TautulliClient, StubTautulli()), days=7, initial_batch_size=100)
         assert len(result) == 1
@@ -632,21 +494,11 @@ class TestBuildDiscordPayloadSuppression:
         """Items exceeding DEFAULT_INFO_DISPLAY_LIMIT per type should log a suppression summary."""
         from src.app import DEFAULT_INFO_DISPLAY_LIMIT
 
-        timestamp = int(datetime.now(UTC).timestamp())
-        items: list[TautulliMediaItem] = [
-            {"media_type": "movie", "title": f"Movie {i}", "added_at": timestamp}
-            for i in range(DEFAULT_INFO_DISPLAY_LIMIT + 3)  # 3 over the limit → suppressed count = 3
-        ]
+        items = _recent_items(DEFAULT_INFO_DISPLAY_LIMIT + 3)  # 3 over the limit → suppressed count = 3
 
-        # Force the "app" logger to INFO so debug_enabled is False inside _build_discord_payload
-        app_logger = logging.getLogger("app")
-        old_level = app_logger.level
-        app_logger.setLevel(logging.INFO)
-        caplog.set_level("INFO", logger="app")
-        try:
-            result = _build_discord_payload(items)
-        finally:
-            app_logger.setLevel(old_level)
+        # caplog sets the "app" logger itself to INFO (restored at teardown) so debug_enabled is False
+        caplog.set_level(logging.INFO, logger="app")
+        result = _build_discord_payload(items)
 
         assert len(result) == DEFAULT_INFO_DISPLAY_LIMIT + 3
         suppression_msgs = [r.message for r in caplog.records if "additional items hidden" in r.message]
@@ -657,7 +509,8 @@ class TestBuildDiscordPayloadSuppression:
 class TestSendDiscordNotification:
     """Tests for _send_discord_notification error-handling paths."""
 
-    def _make_config(self, *, plex_server_id=None, run_once=True):
+    @staticmethod
+    def _make_config(*, plex_server_id=None, run_once=True):
         return Config.model_validate(
             {
                 "tautulli_url": "http://tautulli:8181",
@@ -668,25 +521,44 @@ class TestSendDiscordNotification:
             }
         )
 
-    @pytest.mark.unit
-    def test_request_exception_fetching_server_id_warns_and_continues(self, monkeypatch, caplog):
-        """RequestException during server ID auto-fetch should warn and not abort."""
+    @staticmethod
+    def _tautulli(identity=None):
+        """Stub Tautulli client whose get_server_identity returns `identity`, or raises it if it is an exception."""
 
         class StubTautulli:
             def get_server_identity(self):
-                raise requests.RequestException("timeout")
+                if isinstance(identity, Exception):
+                    raise identity
+                return identity
+
+        return cast(TautulliClient, StubTautulli())
+
+    @staticmethod
+    def _patch_notifier(monkeypatch, outcome):
+        """Install a DiscordNotifier whose send_summary returns `outcome`, or raises it if it is an exception."""
 
         class StubNotifier:
             def __init__(self, *a, **kw):
                 pass
 
             def send_summary(self, *a, **kw):
-                return True
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
 
         monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
+
+    @pytest.mark.unit
+    def test_request_exception_fetching_server_id_warns_and_continues(self, monkeypatch, caplog):
+        """RequestException during server ID auto-fetch should warn and not abort."""
+        self._patch_notifier(monkeypatch, True)
         caplog.set_level("WARNING", logger="app")
         result = _send_discord_notification(
-            self._make_config(plex_server_id=None, run_once=False), cast(TautulliClient, StubTautulli()), [], 7, 0
+            self._make_config(plex_server_id=None, run_once=False),
+            self._tautulli(requests.RequestException("timeout")),
+            [],
+            7,
+            0,
         )
         assert result == 0
         assert any("Network error while fetching" in r.message for r in caplog.records)
@@ -694,22 +566,10 @@ class TestSendDiscordNotification:
     @pytest.mark.unit
     def test_value_error_fetching_server_id_warns_and_continues(self, monkeypatch, caplog):
         """ValueError during server ID auto-fetch should warn and not abort."""
-
-        class StubTautulli:
-            def get_server_identity(self):
-                raise ValueError("bad response")
-
-        class StubNotifier:
-            def __init__(self, *a, **kw):
-                pass
-
-            def send_summary(self, *a, **kw):
-                return True
-
-        monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
+        self._patch_notifier(monkeypatch, True)
         caplog.set_level("WARNING", logger="app")
         result = _send_discord_notification(
-            self._make_config(plex_server_id=None, run_once=False), cast(TautulliClient, StubTautulli()), [], 7, 0
+            self._make_config(plex_server_id=None, run_once=False), self._tautulli(ValueError("bad response")), [], 7, 0
         )
         assert result == 0
         assert any("Invalid response from Tautulli" in r.message for r in caplog.records)
@@ -717,127 +577,45 @@ class TestSendDiscordNotification:
     @pytest.mark.unit
     def test_empty_machine_identifier_logs_warning(self, monkeypatch, caplog):
         """Empty machine_identifier in auto-detected identity should log a warning."""
-
-        class StubTautulli:
-            def get_server_identity(self):
-                return {"machine_identifier": ""}
-
-        class StubNotifier:
-            def __init__(self, *a, **kw):
-                pass
-
-            def send_summary(self, *a, **kw):
-                return True
-
-        monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
+        self._patch_notifier(monkeypatch, True)
         caplog.set_level("WARNING", logger="app")
         result = _send_discord_notification(
-            self._make_config(plex_server_id=None), cast(TautulliClient, StubTautulli()), [], 7, 0
+            self._make_config(plex_server_id=None), self._tautulli({"machine_identifier": ""}), [], 7, 0
         )
         assert result == 0
         assert any("Could not auto-detect" in r.message for r in caplog.records)
 
     @pytest.mark.unit
-    def test_discord_request_exception_run_once_returns_1(self, monkeypatch):
-        """RequestException from Discord send should return 1 in run_once mode."""
-
-        class StubTautulli:
-            pass
-
-        class StubNotifier:
-            def __init__(self, *a, **kw):
-                pass
-
-            def send_summary(self, *a, **kw):
-                raise requests.RequestException("net error")
-
-        monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
-        result = _send_discord_notification(
-            self._make_config(plex_server_id="srv", run_once=True), cast(TautulliClient, StubTautulli()), [], 7, 0
-        )
-        assert result == 1
-
-    @pytest.mark.unit
-    def test_discord_value_error_run_once_returns_1(self, monkeypatch):
-        """ValueError from Discord send should return 1 in run_once mode."""
-
-        class StubTautulli:
-            pass
-
-        class StubNotifier:
-            def __init__(self, *a, **kw):
-                pass
-
-            def send_summary(self, *a, **kw):
-                raise ValueError("invalid config")
-
-        monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
-        result = _send_discord_notification(
-            self._make_config(plex_server_id="srv", run_once=True), cast(TautulliClient, StubTautulli()), [], 7, 0
-        )
-        assert result == 1
-
-    @pytest.mark.unit
-    def test_discord_generic_exception_run_once_returns_1(self, monkeypatch):
-        """Unhandled exception from Discord send should return 1 in run_once mode."""
-
-        class StubTautulli:
-            pass
-
-        class StubNotifier:
-            def __init__(self, *a, **kw):
-                pass
-
-            def send_summary(self, *a, **kw):
-                raise RuntimeError("unexpected boom")
-
-        monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            pytest.param(requests.RequestException("net error"), id="request-exception"),
+            pytest.param(ValueError("invalid config"), id="value-error"),
+            pytest.param(RuntimeError("unexpected boom"), id="generic-exception"),
+            pytest.param(False, id="send-summary-false"),
+        ],
+    )
+    def test_discord_failure_run_once_returns_1(self, monkeypatch, outcome):
+        """A failed Discord send, raised or reported, should return 1 in run_once mode."""
+        self._patch_notifier(monkeypatch, outcome)
         result = _send_discord_notification(
-            self._make_config(plex_server_id="srv", run_once=True), cast(TautulliClient, StubTautulli()), [], 7, 0
+            self._make_config(plex_server_id="srv", run_once=True), self._tautulli(), [], 7, 0
         )
         assert result == 1
 
     @pytest.mark.unit
-    def test_send_summary_false_run_once_returns_1(self, monkeypatch):
-        """send_summary returning False in run_once mode should return 1."""
-
-        class StubTautulli:
-            pass
-
-        class StubNotifier:
-            def __init__(self, *a, **kw):
-                pass
-
-            def send_summary(self, *a, **kw):
-                return False
-
-        monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
+    @pytest.mark.parametrize(
+        "outcome",
+        [requests.RequestException("e"), ValueError("v"), RuntimeError("r")],
+        ids=["request-exception", "value-error", "generic-exception"],
+    )
+    def test_discord_errors_non_fatal_in_scheduled_mode(self, monkeypatch, outcome):
+        """All Discord errors should return 0 (non-fatal) in scheduled mode."""
+        self._patch_notifier(monkeypatch, outcome)
         result = _send_discord_notification(
-            self._make_config(plex_server_id="srv", run_once=True), cast(TautulliClient, StubTautulli()), [], 7, 0
+            self._make_config(plex_server_id="srv", run_once=False), self._tautulli(), [], 7, 0
         )
-        assert result == 1
-
-    @pytest.mark.unit
-    def test_discord_errors_non_fatal_in_scheduled_mode(self, monkeypatch):
-        """All Discord errors should return 0 (non-fatal) in scheduled mode."""
-        for exc in [requests.RequestException("e"), ValueError("v"), RuntimeError("r")]:
-            the_exc = exc
-
-            class StubTautulli:
-                pass
-
-            class StubNotifier:
-                def __init__(self, *a, **kw):
-                    pass
-
-                def send_summary(self, *a, _exc=the_exc, **kw):
-                    raise _exc
-
-            monkeypatch.setattr("src.app.DiscordNotifier", StubNotifier)
-            result = _send_discord_notification(
-                self._make_config(plex_server_id="srv", run_once=False), cast(TautulliClient, StubTautulli()), [], 7, 0
-            )
-            assert result == 0
+        assert result == 0
 
 
 class TestRunSummaryFetchErrors:
@@ -861,7 +639,7 @@ class TestRunSummaryFetchErrors:
             raise requests.RequestException("timeout")
 
         monkeypatch.setattr("src.app._fetch_items", raise_net_error)
-        monkeypatch.setattr("src.app.TautulliClient", lambda *a, **kw: None)
+        monkeypatch.setattr("src.app.TautulliClient", lambda *a, **kw: nullcontext())
         assert run_summary(self._base_config()) == 1
 
     @pytest.mark.unit
@@ -872,7 +650,7 @@ class TestRunSummaryFetchErrors:
             raise ValueError("bad data")
 
         monkeypatch.setattr("src.app._fetch_items", raise_val_error)
-        monkeypatch.setattr("src.app.TautulliClient", lambda *a, **kw: None)
+        monkeypatch.setattr("src.app.TautulliClient", lambda *a, **kw: nullcontext())
         assert run_summary(self._base_config()) == 1
 
     @pytest.mark.unit
@@ -883,7 +661,7 @@ class TestRunSummaryFetchErrors:
             raise RuntimeError("something broke")
 
         monkeypatch.setattr("src.app._fetch_items", raise_unexpected)
-        monkeypatch.setattr("src.app.TautulliClient", lambda *a, **kw: None)
+        monkeypatch.setattr("src.app.TautulliClient", lambda *a, **kw: nullcontext())
         assert run_summary(self._base_config()) == 1
 
 
@@ -3,7 +3,7 @@
 import pytest
 from discord_webhook import DiscordEmbed
 
-from src.discord_client import DiscordMediaItem, DiscordNotifier
+from src.discord_client import DiscordMediaItem, DiscordNotifier, _TokenBucket
 
 
 class TestDiscordNotifier:
@@ -147,6 +147,13 @@ class TestDiscordNotifier:
         assert len(grouped["TV Shows"]) == 1
         assert len(grouped["Music Albums"]) == 1
 
+    @pytest.mark.unit
+    def test_group_items_by_type_omits_empty_categories(self, notifier):
+        """Only categories that received at least one item should be present."""
+        items: list[DiscordMediaItem] = [{"type": "movie", "title": "Movie 1"}]
+        grouped = notifier._group_items_by_type(items)
+        assert list(grouped) == ["Movies"]
+
     @pytest.mark.unit
     def test_group_items_by_type_unknown(self, notifier):
         """Test grouping with unknown media type — should land in Other, not be dropped."""
@@ -157,6 +164,23 @@ class TestDiscordNotifier:
         assert len(grouped["Other"]) == 1
         assert grouped["Other"][0]["title"] == "Unknown Item"
 
+    @pytest.mark.unit
+    def test_dedupe_items_keeps_first_occurrence(self, notifier):
+        """Repeated rating keys (or identical unkeyed items) should be sent only once."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": "Movie A", "added_at": "2025-01-01", "rating_key": 1},
+            {"type": "movie", "title": "Movie A (again)", "added_at": "2025-01-02", "rating_key": 1},
+            {"type": "movie", "title": "No Key", "added_at": "2025-01-03"},
+            {"type": "movie", "title": "No Key", "added_at": "2025-01-03"},
+            {"type": "movie", "title": "No Key", "added_at": "2025-01-04"},
+        ]
+        deduped = notifier._dedupe_items(items)
+        assert [(item["title"], item["added_at"]) for item in deduped] == [
+            ("Movie A", "2025-01-01"),
+            ("No Key", "2025-01-03"),
+            ("No Key", "2025-01-04"),
+        ]
+
     @pytest.mark.unit
     def test_format_media_item_with_link(self, notifier):
         """Test formatting media item with Plex link."""
@@ -184,6 +208,17 @@ class TestDiscordNotifier:
         formatted = notifier._format_media_item(item)
         assert formatted == "• **Test Movie**"
 
+    @pytest.mark.unit
+    def test_format_media_item_reuses_cached_line(self, notifier, monkeypatch):
+        """Formatting the same item again (e.g. on a trim retry) should not re-escape the title."""
+        escape_calls: list[str] = []
+        monkeypatch.setattr("src.discord_client._escape_title_markdown", lambda text: escape_calls.append(text) or text)
+        item: DiscordMediaItem = {"type": "movie", "rating_key": "12345", "title": "Test Movie"}
+        first = notifier._format_media_item(item)
+        second = notifier._format_media_item(item)
+        assert first == second
+        assert escape_calls == ["Test Movie"]
+
     @pytest.mark.unit
     def test_validate_and_trim_embed_within_limits(self, notifier):
         """Test that embed within limits is not trimmed."""
@@ -193,7 +228,11 @@ class TestDiscordNotifier:
         ]
 
         embed, items_sent = notifier._validate_and_trim_embed(
-            category="Movies", items=items, days_back=7, part_num=1, category_total=2, all_items=items
+            category="Movies",
+            items=items,
+            heading=notifier._category_heading("Movies", 7, 2),
+            part_num=1,
+            all_items=items,
         )
 
         assert items_sent == 2  # All items should be included
@@ -209,7 +248,11 @@ class TestDiscordNotifier:
         ]
 
         embed, items_sent = notifier._validate_and_trim_embed(
-            category="Movies", items=items, days_back=7, part_num=1, category_total=25, all_items=items
+            category="Movies",
+            items=items,
+            heading=notifier._category_heading("Movies", 7, 25),
+            part_num=1,
+            all_items=items,
         )
 
         # Some items should be trimmed
@@ -238,6 +281,14 @@ class TestDiscordNotifier:
             assert isinstance(DiscordNotifier.MEDIA_ICONS[category], str)
             assert len(DiscordNotifier.MEDIA_ICONS[category]) > 0
 
+    @pytest.mark.unit
+    def test_shared_class_constants_are_immutable(self):
+        """Class-level lookup tables should be read-only so instances cannot mutate shared state."""
+        assert isinstance(DiscordNotifier.NO_NEW_TITLES, tuple)
+        assert isinstance(DiscordNotifier.NO_NEW_MESSAGES, tuple)
+        with pytest.raises(TypeError):
+            DiscordNotifier.MEDIA_ICONS["Movies"] = "X"  # type: ignore[index]
+
     @pytest.mark.unit
     def test_send_with_retry_passes_timeout_when_supported(self, notifier):
         """Webhook execution should set timeout attribute when supported."""
@@ -329,18 +380,20 @@ class TestDiscordNotifier:
 
     @pytest.mark.unit
     def test_send_with_retry_respects_rate_limit_429(self, notifier, monkeypatch):
-        """_send_with_retry should wait retry_after seconds and retry on 429 responses."""
+        """_send_with_retry should wait the Retry-After header value (plus jitter) and retry on 429 responses."""
         sleep_calls: list[float] = []
         monkeypatch.setattr("src.discord_client.time.sleep", lambda s: sleep_calls.append(s))
+        monkeypatch.setattr("src.discord_client.random.uniform", lambda a, b: 0.25)
 
         attempt = {"n": 0}
 
         class StubResponse429:
             status_code = 429
             text = ""
+            headers = {"Retry-After": "2.5"}
 
             def json(self):
-                return {"retry_after": 2.5}
+                raise AssertionError("429 handling should not decode the response body")
 
         class StubResponse204:
             status_code = 204
@@ -364,7 +417,7 @@ class TestDiscordNotifier:
 
         assert response.status_code == 204
         assert attempt["n"] == 2  # one 429, one success
-        assert 2.5 in sleep_calls  # waited the retry_after value
+        assert sleep_calls == [2.75]  # waited Retry-After plus jitter
 
     @pytest.mark.unit
     def test_send_with_retry_exhausts_retries_on_persistent_429(self, notifier, monkeypatch):
@@ -375,8 +428,10 @@ class TestDiscordNotifier:
             status_code = 429
             text = ""
 
+            headers = {"Retry-After": "0.1"}
+
             def json(self):
-                return {"retry_after": 0.1}
+                return {}
 
         class StubWebhook:
             def __init__(self):
@@ -390,6 +445,89 @@ class TestDiscordNotifier:
 
         assert response.status_code == 429
 
+    @pytest.mark.unit
+    def test_send_with_retry_pauses_limiter_when_bucket_drained(self, notifier, monkeypatch):
+        """A success reporting X-RateLimit-Remaining: 0 should make the next send wait for the reset."""
+        clock = {"now": 100.0}
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.discord_client.time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("src.discord_client.time.sleep", lambda s: sleep_calls.append(s))
+        notifier._rate_limiter = _TokenBucket(capacity=5, refill_rate=2.5)
+
+        class StubResponse204:
+            status_code = 204
+            text = ""
+            headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"}
+
+        class StubWebhook:
+            def __init__(self):
+                self.timeout = None
+
+            def execute(self):
+                return StubResponse204()
+
+        notifier._send_with_retry(StubWebhook())
+        assert sleep_calls == []
+
+        notifier._rate_limiter.acquire()
+        assert sleep_calls == [1.5]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("reset_after", ["soon", "inf", ""], ids=["non-numeric", "infinite", "empty"])
+    def test_send_with_retry_ignores_malformed_reset_header_on_success(self, notifier, monkeypatch, reset_after):
+        """A malformed X-RateLimit-Reset-After on an accepted send must not re-execute the webhook."""
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.discord_client.time.sleep", lambda s: sleep_calls.append(s))
+
+        executions = {"n": 0}
+
+        class StubResponse204:
+            status_code = 204
+            text = ""
+            headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": reset_after}
+
+        class StubWebhook:
+            def __init__(self):
+                self.timeout = None
+
+            def execute(self):
+                executions["n"] += 1
+                return StubResponse204()
+
+        response = notifier._send_with_retry(StubWebhook(), max_retries=3)
+
+        assert response.status_code == 204
+        assert executions["n"] == 1  # Discord accepted it; retrying would post the summary twice
+        assert sleep_calls == []
+
+    @pytest.mark.unit
+    def test_send_with_retry_falls_back_when_retry_after_is_malformed(self, notifier, monkeypatch):
+        """A 429 with a non-numeric Retry-After should use X-RateLimit-Reset-After rather than fail the attempt."""
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.discord_client.time.sleep", lambda s: sleep_calls.append(s))
+        monkeypatch.setattr("src.discord_client.random.uniform", lambda a, b: 0.0)
+
+        responses = iter([429, 204])
+
+        class StubResponse:
+            text = ""
+            headers = {"Retry-After": "later", "X-RateLimit-Reset-After": "3"}
+
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+        class StubWebhook:
+            def __init__(self):
+                self.timeout = None
+
+            def execute(self):
+                return StubResponse(next(responses))
+
+        response = notifier._send_with_retry(StubWebhook(), max_retries=3)
+
+        assert response.status_code == 204
+        assert sleep_calls == [3.0]
+
 
 class TestSendWithRetryBackoffAndExhaustion:
     """Tests for _send_with_retry exception backoff and re-raise paths."""
@@ -498,6 +636,19 @@ class TestFormatMediaItemLocalUrl:
         assert "/desktop" in formatted
         assert "/web/index.html" not in formatted
 
+    @pytest.mark.unit
+    def test_link_uses_url_encoded_metadata_key(self):
+        """The details link should carry the URL-encoded /library/metadata/<rating_key> path."""
+        notifier = DiscordNotifier(
+            webhook_url="https://discord.com/api/webhooks/test",
+            plex_url="http://plex:32400/",
+            plex_server_id="srv-abc",
+        )
+        item: DiscordMediaItem = {"type": "movie", "rating_key": 42, "title": "Local Movie"}
+        assert notifier._format_media_item(item) == (
+            "• [Local Movie](http://plex:32400/web/index.html#!/server/srv-abc/details?key=%2Flibrary%2Fmetadata%2F42)"
+        )
+
 
 class TestGetDateRangeFieldName:
     """Tests for _get_date_range_field_name edge cases."""
@@ -535,6 +686,45 @@ class TestGetDateRangeFieldName:
         field_name = notifier._get_date_range_field_name(items, chunk_num=1)
         assert field_name == "15/03"
 
+    @pytest.mark.unit
+    def test_date_range_spans_first_to_last_item(self, notifier):
+        """Different first/last dates should render as a DD/MM - DD/MM range."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": "A", "added_at": "2024-12-30"},
+            {"type": "movie", "title": "B", "added_at": "2025-01-02"},
+        ]
+        assert notifier._get_date_range_field_name(items, chunk_num=1) == "30/12 - 02/01"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "added_at",
+        ["2025-13-01", "2025-02-30", "2025-04-31", "2025-02-29", "0000-01-01"],
+        ids=["month-13", "february-30", "april-31", "non-leap-february-29", "year-zero"],
+    )
+    def test_impossible_date_falls_back_to_items_label(self, notifier, added_at):
+        """Strings shaped like a date but naming a day that does not exist should not be displayed."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": "A", "added_at": added_at},
+        ]
+        assert notifier._get_date_range_field_name(items, chunk_num=1) == "Items"
+
+    @pytest.mark.unit
+    def test_impossible_last_date_falls_back_to_items_label(self, notifier):
+        """A valid first date should not be paired with an impossible last date."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": "A", "added_at": "2025-02-01"},
+            {"type": "movie", "title": "B", "added_at": "2025-02-30"},
+        ]
+        assert notifier._get_date_range_field_name(items, chunk_num=1) == "Items"
+
+    @pytest.mark.unit
+    def test_leap_day_is_displayed(self, notifier):
+        """February 29th of a leap year is a real date and should be displayed."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": "A", "added_at": "2024-02-29"},
+        ]
+        assert notifier._get_date_range_field_name(items, chunk_num=1) == "29/02"
+
     @pytest.mark.unit
     def test_empty_items_chunk_1_returns_items(self, notifier):
         """Empty items list with chunk_num=1 should return the bare 'Items' label."""
@@ -569,6 +759,21 @@ class TestAddItemsToEmbedFieldSplit:
         notifier._add_items_to_embed(embed, items, "Movies")
         assert len(embed.fields) >= 2
 
+    @pytest.mark.unit
+    def test_fields_are_filled_up_to_limit_and_keep_every_item(self, notifier):
+        """Each field should take as many lines as fit, and an oversized line should get a field of its own."""
+        # "• **" + 90 chars + "**" = 96 chars, +1 newline = 97; 10 lines fit in 1024 - 50 = 974
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": "A" * 90, "added_at": f"2025-01-{i:02d}"} for i in range(1, 12)
+        ]
+        items.append({"type": "movie", "title": "B" * 1000, "added_at": "2025-01-20"})
+        embed = DiscordEmbed()
+        notifier._add_items_to_embed(embed, items, "Movies")
+
+        line_counts = [len(field["value"].split("\n")) for field in embed.fields]
+        assert line_counts == [10, 1, 1]
+        assert embed.fields[0]["name"] == "01/01 - 10/01"
+
 
 class TestValidateAndTrimEmbedCannotReduce:
     """Tests for _validate_and_trim_embed when items cannot be reduced further."""
@@ -589,9 +794,8 @@ class TestValidateAndTrimEmbedCannotReduce:
         _embed, items_sent = notifier._validate_and_trim_embed(
             category="Movies",
             items=items,
-            days_back=7,
+            heading=notifier._category_heading("Movies", 7, 1),
             part_num=1,
-            category_total=1,
             all_items=items,
         )
         assert items_sent == 1
@@ -619,9 +823,8 @@ class TestValidateAndTrimEmbedTrimmedFits:
         _embed, items_sent = notifier._validate_and_trim_embed(
             category="Movies",
             items=items,
-            days_back=7,
+            heading=notifier._category_heading("Movies", 7, 5),
             part_num=1,
-            category_total=5,
             all_items=items,
         )
         assert items_sent < len(items)
@@ -800,9 +1003,10 @@ class TestSendSummaryMultiPart:
 
     @pytest.mark.unit
     def test_26_items_sends_two_parts(self, notifier, monkeypatch, caplog):
-        """26 items in one category should trigger two separate webhook sends."""
+        """26 items in one category should produce two embeds, packed into one webhook send when small."""
         monkeypatch.setattr("src.discord_client.time.sleep", lambda _: None)
         webhook_executions = {"n": 0}
+        embeds_sent: list[DiscordEmbed] = []
 
         class StubResponse:
             status_code = 204
@@ -819,6 +1023,7 @@ class TestSendSummaryMultiPart:
 
             def add_embed(self, e):
                 self.embeds.append(e)
+                embeds_sent.append(e)
 
             def execute(self):
                 return StubResponse()
@@ -832,10 +1037,44 @@ class TestSendSummaryMultiPart:
         ]
         result = notifier.send_summary(items, days_back=7, total_count=26)
         assert result is True
-        assert webhook_executions["n"] == 2
+        assert len(embeds_sent) == 2
+        assert webhook_executions["n"] == 1
         # The "part N, M items sent, K remaining" log line should appear
         assert any("remaining" in r.message for r in caplog.records)
 
+    @pytest.mark.unit
+    def test_build_category_messages_splits_and_sorts(self, notifier):
+        """Items should be sorted oldest first and split into full-size parts before anything is sent."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": f"Movie {i}", "added_at": f"2025-01-{28 - (i % 28):02d}"} for i in range(26)
+        ]
+        messages = notifier._build_category_messages("Movies", items, days_back=7)
+        assert [count for _embed, count in messages] == [25, 1]
+        assert items[0]["added_at"] <= items[-1]["added_at"]
+        assert "(Part 2)" in messages[1][0].title
+        assert messages[0][0].title == "🎬 Movies - Last 7 days (Part 1)"
+        assert messages[0][0].description == messages[1][0].description == "**26 movies added**"
+
+    @pytest.mark.unit
+    def test_category_heading_singular_and_plural(self, notifier):
+        """Headings should use singular labels for one item and pluralise the day count."""
+        assert notifier._category_heading("TV Episodes", 1, 1) == (
+            "📺 TV Episodes - Last 1 day",
+            "**1 TV episode added**",
+        )
+        assert notifier._category_heading("Other", 3, 2) == ("📁 Other - Last 3 days", "**2 items added**")
+
+    @pytest.mark.unit
+    def test_build_category_messages_shares_footer_and_handles_missing_dates(self, notifier):
+        """Every part should carry the same footer, and undated items should sort first instead of failing."""
+        items: list[DiscordMediaItem] = [
+            {"type": "movie", "title": f"Movie {i}", "added_at": "2025-01-02"} for i in range(25)
+        ]
+        items.append({"type": "movie", "title": "Undated"})
+        messages = notifier._build_category_messages("Movies", items, days_back=7, footer_text="Generated on X")
+        assert items[0]["title"] == "Undated"
+        assert [embed.footer["text"] for embed, _count in messages] == ["Generated on X", "Generated on X"]
+
 
 class TestSendSummaryWithItems:
     """Tests for send_summary with non-empty media item lists."""
@@ -940,10 +1179,11 @@ class TestSendSummaryWithItems:
         assert result is False
 
     @pytest.mark.unit
-    def test_multiple_categories_each_send_a_message(self, notifier, monkeypatch):
-        """Items in two different categories should each produce a separate webhook send."""
+    def test_multiple_categories_share_one_message(self, notifier, monkeypatch):
+        """Small embeds for different categories should be packed, in display order, into one webhook send."""
         monkeypatch.setattr("src.discord_client.time.sleep", lambda _: None)
         webhook_count = {"n": 0}
+        sent_titles: list[str] = []
 
         class StubResponse:
             status_code = 204
@@ -960,18 +1200,32 @@ class TestSendSummaryWithItems:
 
             def add_embed(self, e):
                 self.embeds.append(e)
+                sent_titles.append(e.title)
 
             def execute(self):
                 return StubResponse()
 
         monkeypatch.setattr("src.discord_client.DiscordWebhook", StubWebhook)
         items: list[DiscordMediaItem] = [
-            {"type": "movie", "title": "Movie A", "added_at": "2025-01-01"},
             {"type": "episode", "title": "Show S01E01", "added_at": "2025-01-02"},
+            {"type": "movie", "title": "Movie A", "added_at": "2025-01-01"},
         ]
         result = notifier.send_summary(items, days_back=7, total_count=2)
         assert result is True
-        assert webhook_count["n"] == 2
+        assert webhook_count["n"] == 1
+        assert [title.split(" - ")[0] for title in sent_titles] == ["🎬 Movies", "📺 TV Episodes"]
+
+    @pytest.mark.unit
+    def test_pack_embeds_respects_count_and_size_limits(self, notifier):
+        """Batches should hold at most MAX_EMBEDS_PER_MESSAGE embeds and stay under the combined size limit."""
+        small = DiscordEmbed(title="x" * 10)
+        large = DiscordEmbed(title="y" * (notifier.MAX_EMBED_SIZE - 5))
+        messages = [("Movies", i, small, 1) for i in range(1, 13)] + [("Other", 1, large, 1)]
+
+        batches = notifier._pack_embeds(messages)
+
+        assert [len(batch) for batch in batches] == [10, 2, 1]
+        assert batches[-1][0][2] is large
 
     @pytest.mark.unit
     def test_network_exception_from_send_returns_false(self, notifier, monkeypatch):
@@ -1046,7 +1300,7 @@ class TestSendSummaryWithItems:
 
             def execute(self):
                 call_count["n"] += 1
-                # First category succeeds, second fails
+                # First request succeeds, second fails
                 status = 204 if call_count["n"] == 1 else 500
 
                 class R:
@@ -1061,11 +1315,59 @@ class TestSendSummaryWithItems:
                 return r
 
         monkeypatch.setattr("src.discord_client.DiscordWebhook", StubWebhook)
+        # Long titles keep each category's embed large enough to need its own request
         items: list[DiscordMediaItem] = [
-            {"type": "movie", "title": "Movie A", "added_at": "2025-01-01"},
-            {"type": "episode", "title": "Show S01E01", "added_at": "2025-01-02"},
+            *({"type": "movie", "title": f"Movie {i} " + "M" * 150, "added_at": "2025-01-01"} for i in range(20)),
+            *({"type": "episode", "title": f"Show {i} " + "E" * 150, "added_at": "2025-01-02"} for i in range(20)),
         ]
         caplog.set_level("WARNING")
-        result = notifier.send_summary(items, days_back=7, total_count=2)
+        result = notifier.send_summary(items, days_back=7, total_count=40)
+        assert call_count["n"] == 2
         assert result is False
         assert any("Partial Discord send" in r.message for r in caplog.records)
+
+
+class TestTokenBucket:
+    """Tests for the client-side Discord rate limiter."""
+
+    @pytest.mark.unit
+    def test_burst_within_capacity_does_not_sleep(self, monkeypatch):
+        """Sends up to the bucket capacity should go out without any delay."""
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.discord_client.time.monotonic", lambda: 100.0)
+        monkeypatch.setattr("src.discord_client.time.sleep", lambda s: sleep_calls.append(s))
+        bucket = _TokenBucket(capacity=5, refill_rate=2.5)
+        for _ in range(5):
+            bucket.acquire()
+        assert sleep_calls == []
+
+    @pytest.mark.unit
+    def test_depleted_bucket_sleeps_until_next_token(self, monkeypatch):
+        """Once empty, acquire should wait only for the time needed to refill one token."""
+        clock = {"now": 100.0}
+        sleep_calls: list[float] = []
+
+        def fake_sleep(seconds):
+            sleep_calls.append(seconds)
+            clock["now"] += seconds
+
+        monkeypatch.setattr("src.discord_client.time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("src.discord_client.time.sleep", fake_sleep)
+        bucket = _TokenBucket(capacity=2, refill_rate=2.5)
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+        assert sleep_calls == [pytest.approx(0.4)]
+
+    @pytest.mark.unit
+    def test_elapsed_time_refills_tokens(self, monkeypatch):
+        """Time passing between sends should restore capacity without sleeping."""
+        clock = {"now": 100.0}
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.discord_client.time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("src.discord_client.time.sleep", lambda s: sleep_calls.append(s))
+        bucket = _TokenBucket(capacity=1, refill_rate=2.5)
+        bucket.acquire()
+        clock["now"] += 1.0
+        bucket.acquire()
+        assert sleep_calls == []
@@ -24,3 +24,8 @@ class TestEscapeTitleMarkdown:
     def test_minimal_escapes_brackets(self):
         """Test that link text brackets are escaped."""
         assert _escape_title_markdown("Movie [Soon]") == "Movie \\[Soon\\]"
+
+    @pytest.mark.unit
+    def test_minimal_escapes_backslash_once(self):
+        """Test that backslashes are escaped exactly once, even next to other metacharacters."""
+        assert _escape_title_markdown("AC\\DC *Live*") == "AC\\\\DC \\*Live\\*"
@@ -2,7 +2,7 @@
 Integration tests: full pipeline from Tautulli HTTP response → app logic → Discord webhook.
 
 Unlike unit tests which stub at the class level, these tests only mock at the
-HTTP boundary (requests.get for Tautulli, DiscordWebhook.execute for Discord),
+HTTP boundary (requests.Session.get for Tautulli, DiscordWebhook.execute for Discord),
 letting all real application code run: TautulliClient, DiscordNotifier, config
 validation, batch-fetch logic, date filtering, and Discord embed building.
 """
@@ -94,8 +94,9 @@ class TestHappyPath:
     def test_movies_and_episodes_dispatched_to_discord(self, config_with_discord, mocker):
         """
         Mixed media items (movie + episode) flow through the full pipeline.
-        DiscordNotifier sends one webhook call per media-type category, so 2 items
-        of different types (movie + episode) result in 2 execute() calls.
+        DiscordNotifier builds one embed per media-type category and packs small
+        embeds into a single webhook request, so 2 items of different types
+        (movie + episode) result in 1 execute() call carrying 2 embeds.
         """
         items = [
             {
@@ -115,9 +116,9 @@ class TestHappyPath:
             },
         ]
 
-        # requests.get: first call = get_recently_added, second = get_server_identity
+        # requests.Session.get: first call = get_recently_added, second = get_server_identity
         mocker.patch(
-            "requests.get",
+            "requests.Session.get",
             side_effect=[_recently_added_resp(items), _server_identity_resp()],
         )
         discord_execute = mocker.patch(
@@ -128,8 +129,8 @@ class TestHappyPath:
         exit_code = run_summary(config_with_discord)
 
         assert exit_code == 0
-        # One webhook call per category: Movies (1) + TV Episodes (1) = 2
-        assert discord_execute.call_count == 2
+        # Movies + TV Episodes embeds fit in one webhook call
+        assert discord_execute.call_count == 1
 
     @pytest.mark.integration
     def test_no_items_in_window_sends_no_new_items_embed(self, config_with_discord, mocker):
@@ -145,7 +146,7 @@ class TestHappyPath:
         # get_recently_added returns the old item; get_server_identity still needed
         # because discord_webhook_url is set and plex_server_id is not pre-configured.
         mocker.patch(
-            "requests.get",
+            "requests.Session.get",
             side_effect=[_recently_added_resp(old_items), _server_identity_resp()],
         )
         discord_execute = mocker.patch(
@@ -163,7 +164,7 @@ class TestHappyPath:
     def test_no_discord_configured_returns_zero(self, config_no_discord, mocker):
         """When discord_webhook_url is None, run completes cleanly with no HTTP to Discord."""
         items = [{"media_type": "movie", "title": "Solo Run Movie", "added_at": _ts(1), "rating_key": "5"}]
-        mocker.patch("requests.get", return_value=_recently_added_resp(items))
+        mocker.patch("requests.Session.get", return_value=_recently_added_resp(items))
         discord_execute = mocker.patch("discord_webhook.DiscordWebhook.execute")
 
         exit_code = run_summary(config_no_discord)
@@ -183,7 +184,7 @@ class TestErrorPropagation:
         """
         mocker.patch("time.sleep")  # skip retry back-off waits
         mocker.patch(
-            "requests.get",
+            "requests.Session.get",
             side_effect=requests.ConnectionError("Connection refused"),
         )
         discord_execute = mocker.patch("discord_webhook.DiscordWebhook.execute")
@@ -205,7 +206,7 @@ class TestErrorPropagation:
         error_resp.json.return_value = {"response": {"result": "error", "message": "Invalid API key"}}
 
         mocker.patch("time.sleep")
-        mocker.patch("requests.get", return_value=error_resp)
+        mocker.patch("requests.Session.get", return_value=error_resp)
 
         exit_code = run_summary(config_no_discord)
 
@@ -221,7 +222,7 @@ class TestErrorPropagation:
 
         mocker.patch("time.sleep")
         mocker.patch(
-            "requests.get",
+            "requests.Session.get",
             side_effect=[_recently_added_resp(items), _server_identity_resp()],
         )
         mocker.patch(
@@ -264,7 +265,7 @@ class TestBatchFetchLogic:
 
         mocker.patch("time.sleep")  # skip inter-iteration 0.2s delay
         mock_get = mocker.patch(
-            "requests.get",
+            "requests.Session.get",
             side_effect=[_recently_added_resp(batch1), _recently_added_resp(batch2)],
         )
 
@@ -68,3 +68,16 @@ class TestLoggingSetup:
 
         root_logger = logging.getLogger()
         assert root_logger.level == logging.INFO
+
+    @pytest.mark.unit
+    def test_setup_logging_ignores_non_level_module_attributes(self, monkeypatch, tmp_path):
+        """Names of other logging module attributes are not levels and default to INFO."""
+        log_dir = tmp_path / "logs"
+
+        monkeypatch.setattr(logging_config, "LOG_DIR", log_dir)
+        monkeypatch.setattr(logging_config, "LOG_FILE", log_dir / "app.log")
+
+        logging_config.setup_logging("basic_format")
+
+        root_logger = logging.getLogger()
+        assert root_logger.level == logging.INFO
@@ -1,10 +1,10 @@
 """Unit tests for scheduler module."""
 
-from datetime import UTC, datetime
-from typing import cast
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import pytest
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
 
 from src.scheduler import GracefulScheduler, run_scheduled
 
@@ -12,57 +12,43 @@ from src.scheduler import GracefulScheduler, run_scheduled
 class TestGracefulScheduler:
     """Tests for GracefulScheduler behavior."""
 
-    @pytest.mark.unit
-    def test_handle_shutdown_requests_scheduler_stop(self, monkeypatch):
-        """Shutdown handler should mark shutdown and stop running scheduler."""
-
-        monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
-
-        scheduler = GracefulScheduler("0 9 * * *", lambda: 0)
-
-        class StubBlockingScheduler:
-            running = True
-
-            def __init__(self):
-                self.shutdown_called = False
-
-            def shutdown(self, wait=False):
-                self.shutdown_called = True
-                self.wait_arg = wait
+    @staticmethod
+    def _use_timezone(monkeypatch, timezone):
+        """Make start() parse its CRON expression into a real CronTrigger in `timezone`."""
+        from_crontab = CronTrigger.from_crontab
+        monkeypatch.setattr(
+            "apscheduler.triggers.cron.CronTrigger.from_crontab", lambda expr: from_crontab(expr, timezone=timezone)
+        )
 
-        stub = StubBlockingScheduler()
-        scheduler.scheduler = cast(BlockingScheduler, stub)
+    @staticmethod
+    def _fake_clock(monkeypatch, scheduler, start, *, shutdown_on_wait=None):
+        """Fake the loop clock: each wait advances it by its timeout, and wait `shutdown_on_wait` reports shutdown."""
+        clock = {"now": start.timestamp()}
+        waits: list[float] = []
 
-        scheduler._handle_shutdown(15, None)
+        def wait(timeout):
+            waits.append(timeout)
+            if len(waits) == shutdown_on_wait:
+                return True
+            clock["now"] += timeout
+            return False
 
-        assert scheduler._shutdown_requested is True
-        assert stub.shutdown_called is True
-        assert stub.wait_arg is False
+        monkeypatch.setattr("src.scheduler.time.time", lambda: clock["now"])
+        monkeypatch.setattr(scheduler._shutdown_event, "wait", wait)
+        return clock, waits
 
     @pytest.mark.unit
-    def test_handle_shutdown_skips_stop_when_scheduler_not_running(self, monkeypatch):
-        """Shutdown handler should not call scheduler.shutdown() if it is not running."""
+    def test_handle_shutdown_requests_scheduler_stop(self, monkeypatch):
+        """Shutdown handler should mark shutdown and wake the waiting scheduling loop."""
 
         monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
 
         scheduler = GracefulScheduler("0 9 * * *", lambda: 0)
 
-        class StubBlockingScheduler:
-            running = False  # not started yet
-
-            def __init__(self):
-                self.shutdown_called = False
-
-            def shutdown(self, wait=False):
-                self.shutdown_called = True
-
-        stub = StubBlockingScheduler()
-        scheduler.scheduler = cast(BlockingScheduler, stub)
-
         scheduler._handle_shutdown(15, None)
 
         assert scheduler._shutdown_requested is True
-        assert stub.shutdown_called is False  # should NOT call shutdown
+        assert scheduler._shutdown_event.is_set()
 
     @pytest.mark.unit
     def test_start_invalid_cron_exits_with_code_1(self, monkeypatch):
@@ -70,7 +56,8 @@ class TestGracefulScheduler:
 
         monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
         monkeypatch.setattr(
-            "src.scheduler.CronTrigger.from_crontab", lambda _cron: (_ for _ in ()).throw(ValueError("bad cron"))
+            "apscheduler.triggers.cron.CronTrigger.from_crontab",
+            lambda _cron: (_ for _ in ()).throw(ValueError("bad cron")),
         )
 
         scheduler = GracefulScheduler("invalid cron", lambda: 0)
@@ -97,49 +84,127 @@ class TestGracefulScheduler:
         assert run_scheduled(lambda: 0, "0 9 * * *") == 0
 
     @pytest.mark.unit
-    def test_start_adds_job_and_starts_scheduler(self, monkeypatch):
-        """Scheduler start should register the job and start the blocking scheduler."""
+    def test_start_runs_task_at_fire_time_until_shutdown(self, monkeypatch):
+        """Scheduler should run the task once its fire time arrives and keep going until a shutdown signal."""
 
         monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
 
         class StubTrigger:
             timezone = UTC
 
+            def __init__(self):
+                self.calls = 0
+
             def get_next_fire_time(self, previous, now):
-                return datetime(2026, 1, 1, tzinfo=UTC)
+                # First fire time is due immediately, later ones are an hour away
+                self.calls += 1
+                return now if self.calls == 1 else now + timedelta(hours=1)
 
-        monkeypatch.setattr("src.scheduler.CronTrigger.from_crontab", lambda _cron: StubTrigger())
+        monkeypatch.setattr("apscheduler.triggers.cron.CronTrigger.from_crontab", lambda _cron: StubTrigger())
 
-        scheduler = GracefulScheduler("0 9 * * *", lambda: 0)
+        runs = {"n": 0}
 
-        class StubBlockingScheduler:
-            def __init__(self):
-                self.add_job_called = False
-                self.start_called = False
-
-            def add_job(self, func, trigger, id, name, coalesce, max_instances):
-                self.add_job_called = True
-                self.func = func
-                self.trigger = trigger
-                self.id = id
-                self.name = name
-                self.coalesce = coalesce
-                self.max_instances = max_instances
+        def task():
+            runs["n"] += 1
+            scheduler._handle_shutdown(15, None)  # signal arrives during the run
+            return 0
 
-            def start(self):
-                self.start_called = True
+        scheduler = GracefulScheduler("0 9 * * *", task)
+
+        scheduler.start()
+
+        assert runs["n"] == 1
+
+    @pytest.mark.unit
+    def test_start_wait_is_interrupted_by_shutdown(self, monkeypatch):
+        """A pending shutdown should end the wait for the next run without running the task."""
+
+        monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
+
+        class StubTrigger:
+            timezone = UTC
+
+            def get_next_fire_time(self, previous, now):
+                return now + timedelta(days=7)
 
-        stub = StubBlockingScheduler()
-        scheduler.scheduler = cast(BlockingScheduler, stub)
+        monkeypatch.setattr("apscheduler.triggers.cron.CronTrigger.from_crontab", lambda _cron: StubTrigger())
+
+        runs = {"n": 0}
+
+        def task():
+            runs["n"] += 1
+            return 0
+
+        scheduler = GracefulScheduler("0 9 * * MON", task)
+        scheduler._handle_shutdown(2, None)
 
         scheduler.start()
 
-        assert stub.add_job_called is True
-        assert stub.start_called is True
-        assert stub.id == "plex_summary_task"
-        assert stub.name == "Plex Summary Task"
-        assert stub.coalesce is True
-        assert stub.max_instances == 1
+        assert runs["n"] == 0
+
+    @pytest.mark.unit
+    def test_wait_spans_real_time_across_dst_transition(self, monkeypatch):
+        """The wait should be in real seconds, so a spring-forward DST change does not delay the run by an hour."""
+        monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
+        timezone = ZoneInfo("America/New_York")
+        self._use_timezone(monkeypatch, timezone)
+
+        scheduler = GracefulScheduler("0 9 * * MON", lambda: 0)
+        # Saturday noon before clocks spring forward on Sunday 2025-03-09: Monday 09:00 is 45 wall-clock hours away
+        _clock, waits = self._fake_clock(
+            monkeypatch, scheduler, datetime(2025, 3, 8, 12, tzinfo=timezone), shutdown_on_wait=1
+        )
+
+        scheduler.start()
+
+        assert waits == [44 * 3600]
+
+    @pytest.mark.unit
+    def test_next_fire_time_is_computed_after_the_run(self, monkeypatch):
+        """After a run, the loop should wait for the following fire time, measured from when the run finished."""
+        monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
+        timezone = ZoneInfo("America/New_York")
+        self._use_timezone(monkeypatch, timezone)
+
+        def task():
+            clock["now"] += 120  # the run itself takes two minutes
+            return 0
+
+        scheduler = GracefulScheduler("0 9 * * MON", task)
+        clock, waits = self._fake_clock(
+            monkeypatch, scheduler, datetime(2025, 1, 6, 8, tzinfo=timezone), shutdown_on_wait=2
+        )
+
+        scheduler.start()
+
+        assert waits == [3600, 7 * 86400 - 120]
+
+    @pytest.mark.unit
+    def test_shutdown_flag_set_during_completed_wait_skips_run(self, monkeypatch):
+        """A shutdown flagged while the wait runs out should stop the loop instead of running the task."""
+        monkeypatch.setattr("src.scheduler.signal.signal", lambda *_args, **_kwargs: None)
+        self._use_timezone(monkeypatch, UTC)
+
+        runs = {"n": 0}
+
+        def task():
+            runs["n"] += 1
+            return 0
+
+        scheduler = GracefulScheduler("0 9 * * MON", task)
+        clock, _waits = self._fake_clock(monkeypatch, scheduler, datetime(2025, 1, 6, 8, tzinfo=UTC))
+
+        def wait(timeout):
+            # The flag is set but the wait still times out, as when the signal lands right at the fire time
+            scheduler._shutdown_requested = True
+            clock["now"] += timeout
+            return False
+
+        monkeypatch.setattr(scheduler._shutdown_event, "wait", wait)
+
+        scheduler.start()
+
+        assert runs["n"] == 0
 
 
 class TestSafeTaskWrapper:
@@ -212,7 +277,7 @@ class TestSchedulerStartFinallyBlocks:
         def raise_runtime(cron):
             raise RuntimeError("unexpected scheduler failure")
 
-        monkeypatch.setattr("src.scheduler.CronTrigger.from_crontab", raise_runtime)
+        monkeypatch.setattr("apscheduler.triggers.cron.CronTrigger.from_crontab", raise_runtime)
         scheduler = GracefulScheduler("0 9 * * *", lambda: 0)
 
         with pytest.raises(SystemExit) as exc_info:
@@ -229,21 +294,13 @@ class TestSchedulerStartFinallyBlocks:
             timezone = UTC
 
             def get_next_fire_time(self, prev, now):
-                return datetime(2026, 1, 1, tzinfo=UTC)
+                return None  # schedule has no further runs -> loop ends without a signal
 
-        monkeypatch.setattr("src.scheduler.CronTrigger.from_crontab", lambda _: StubTrigger())
+        monkeypatch.setattr("apscheduler.triggers.cron.CronTrigger.from_crontab", lambda _: StubTrigger())
 
         scheduler = GracefulScheduler("0 9 * * *", lambda: 0)
         # _shutdown_requested remains False (default)
 
-        class StubBlockingScheduler:
-            def add_job(self, *a, **kw):
-                pass
-
-            def start(self):
-                pass  # returns normally -> scheduler stopped without a signal
-
-        scheduler.scheduler = cast(BlockingScheduler, StubBlockingScheduler())
         caplog.set_level("WARNING")
         scheduler.start()
 
@@ -258,21 +315,13 @@ class TestSchedulerStartFinallyBlocks:
             timezone = UTC
 
             def get_next_fire_time(self, prev, now):
-                return datetime(2026, 1, 1, tzinfo=UTC)
+                return datetime(2999, 1, 1, tzinfo=UTC)
 
-        monkeypatch.setattr("src.scheduler.CronTrigger.from_crontab", lambda _: StubTrigger())
+        monkeypatch.setattr("apscheduler.triggers.cron.CronTrigger.from_crontab", lambda _: StubTrigger())
 
         scheduler = GracefulScheduler("0 9 * * *", lambda: 0)
-        scheduler._shutdown_requested = True  # pre-set as if signal was received
-
-        class StubBlockingScheduler:
-            def add_job(self, *a, **kw):
-                pass
-
-            def start(self):
-                pass
+        scheduler._handle_shutdown(15, None)  # as if the signal was received
 
-        scheduler.scheduler = cast(BlockingScheduler, StubBlockingScheduler())
         caplog.set_level("INFO")
         scheduler.start()
 
@@ -22,6 +22,16 @@ class TestTautulliClient:
         assert "super-secret" not in message
         assert "***" in message
 
+    @pytest.mark.unit
+    def test_sanitize_error_redacts_apikey_parameter_case_insensitively(self):
+        """Query-string credentials should be redacted regardless of parameter case."""
+        client = TautulliClient("http://tautulli:8181", "super-secret")
+
+        message = client._sanitize_error(RuntimeError("GET /api/v2?APIKEY=other-key&cmd=x"))
+
+        assert message == "GET /api/v2?APIKEY=***&cmd=x"
+        assert client._sanitize_error(RuntimeError("connection refused")) == "connection refused"
+
     @pytest.mark.unit
     def test_request_failure_logs_redacted_query_string(self, monkeypatch, caplog):
         """Log output should redact apikey query values on request exceptions."""
@@ -32,7 +42,7 @@ class TestTautulliClient:
                 "failed calling " f"{url}?apikey={params['apikey']}&cmd={params['cmd']}&count={params.get('count', 0)}"
             )
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", raise_request_exception)
+        monkeypatch.setattr(client._session, "get", raise_request_exception)
 
         caplog.set_level("ERROR")
         with pytest.raises(requests.RequestException):
@@ -52,7 +62,7 @@ class TestTautulliClient:
                 "failed calling " f"{url}?apikey={params['apikey']}&cmd={params['cmd']}&count={params.get('count', 0)}"
             )
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", raise_request_exception)
+        monkeypatch.setattr(client._session, "get", raise_request_exception)
 
         with pytest.raises(requests.RequestException) as exc_info:
             client._request("get_recently_added", max_retries=1, count=10)
@@ -76,7 +86,7 @@ class TestTautulliClient:
             }
         }
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *args, **kwargs: response)
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
 
         with pytest.raises(RuntimeError) as exc_info:
             client._request("get_recently_added", max_retries=1, count=10)
@@ -108,7 +118,7 @@ class TestTautulliClient:
             }
         }
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *args, **kwargs: response)
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
 
         with pytest.raises(RuntimeError) as exc_info:
             client.get_recently_added()
@@ -139,7 +149,7 @@ class TestTautulliClient:
             }
         }
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *args, **kwargs: response)
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
 
         with pytest.raises(RuntimeError) as exc_info:
             client.get_recently_added()
@@ -164,7 +174,7 @@ class TestTautulliClient:
             }
         }
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *args, **kwargs: response)
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
 
         with pytest.raises(RuntimeError) as exc_info:
             client.get_server_identity()
@@ -193,7 +203,7 @@ class TestTautulliClient:
             }
         }
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *args, **kwargs: response)
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
 
         result = client.get_recently_added()
 
@@ -201,6 +211,59 @@ class TestTautulliClient:
         assert len(result) == 1
         assert result[0].get("title") == "Test Movie"
 
+    @pytest.mark.unit
+    def test_get_recently_added_drops_unused_item_fields(self, monkeypatch):
+        """Fields outside the media item model should not be carried into the returned items."""
+        client = TautulliClient("http://tautulli:8181", "test-key")
+
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            "response": {
+                "result": "success",
+                "data": [
+                    {
+                        "added_at": 1234567890,
+                        "media_type": "movie",
+                        "title": "Test Movie",
+                        "rating_key": 42,
+                        "thumb": "/library/metadata/42/thumb/1",
+                        "summary": "A long synopsis",
+                    }
+                ],
+            }
+        }
+
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
+
+        item = client.get_recently_added()[0]
+
+        assert item.get("rating_key") == 42
+        assert "thumb" not in item
+        assert "summary" not in item
+
+    @pytest.mark.unit
+    def test_get_recently_added_list_format_reports_failing_item_index(self, monkeypatch):
+        """List format validation errors should name the index of the invalid item."""
+        client = TautulliClient("http://tautulli:8181", "test-key")
+
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            "response": {
+                "result": "success",
+                "data": [
+                    {"added_at": 1234567890, "media_type": "movie", "title": "Valid"},
+                    {"added_at": 1234567890, "media_type": "movie"},
+                ],
+            }
+        }
+
+        monkeypatch.setattr(client._session, "get", lambda *args, **kwargs: response)
+
+        with pytest.raises(RuntimeError, match=r"validation failed: 1\.title"):
+            client.get_recently_added()
+
 
 class TestTautulliClientSanitizeEdgeCases:
     """Edge-case tests for _sanitize_error and _sanitize_exception."""
@@ -239,7 +302,7 @@ class TestTautulliClientHappyPaths:
                 },
             }
         }
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *a, **kw: response)
+        monkeypatch.setattr(client._session, "get", lambda *a, **kw: response)
 
         result = client.get_recently_added()
 
@@ -263,13 +326,39 @@ class TestTautulliClientHappyPaths:
                 },
             }
         }
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *a, **kw: response)
+        monkeypatch.setattr(client._session, "get", lambda *a, **kw: response)
 
         result = client.get_server_identity()
 
         assert isinstance(result, dict)
         assert result.get("machine_identifier") == "abc123"
 
+    @pytest.mark.unit
+    def test_get_server_identity_is_cached_until_ttl_or_invalidate(self, monkeypatch):
+        """Server identity should be fetched once, then served from cache until expiry or invalidation."""
+        client = TautulliClient("http://tautulli:8181", "test-key")
+
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {"response": {"result": "success", "data": {"machine_identifier": "abc123"}}}
+        mock_get = Mock(return_value=response)
+        monkeypatch.setattr(client._session, "get", mock_get)
+        now = [1000.0]
+        monkeypatch.setattr("src.tautulli_client.time.monotonic", lambda: now[0])
+
+        first = client.get_server_identity()
+        first["machine_identifier"] = "mutated"
+        assert client.get_server_identity().get("machine_identifier") == "abc123"
+        assert mock_get.call_count == 1
+
+        now[0] += client.IDENTITY_TTL
+        client.get_server_identity()
+        assert mock_get.call_count == 2
+
+        client.invalidate_identity()
+        client.get_server_identity()
+        assert mock_get.call_count == 3
+
     @pytest.mark.unit
     def test_get_server_identity_list_response_raises_runtime_error(self, monkeypatch):
         """Non-dict data in server identity response should raise RuntimeError."""
@@ -283,7 +372,7 @@ class TestTautulliClientHappyPaths:
                 "data": ["unexpected", "list"],  # List instead of dict
             }
         }
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *a, **kw: response)
+        monkeypatch.setattr(client._session, "get", lambda *a, **kw: response)
 
         with pytest.raises(RuntimeError, match="expected dict"):
             client.get_server_identity()
@@ -305,7 +394,7 @@ class TestTautulliClientUnexpectedFormats:
                 "data": "unexpected-string",  # Not a dict or list
             }
         }
-        monkeypatch.setattr("src.tautulli_client.requests.get", lambda *a, **kw: response)
+        monkeypatch.setattr(client._session, "get", lambda *a, **kw: response)
 
         with pytest.raises(RuntimeError, match="Unexpected response format"):
             client.get_recently_added()
@@ -331,14 +420,107 @@ class TestTautulliClientRetryLogic:
             resp.json.return_value = {"response": {"result": "success", "data": {"recently_added": []}}}
             return resp
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", mock_get)
-
         client = TautulliClient("http://tautulli:8181", "key")
+        monkeypatch.setattr(client._session, "get", mock_get)
+
         client._request("get_recently_added", max_retries=3, count=10)
 
         assert attempt_counter["n"] == 3
         assert len(sleep_calls) == 2  # slept between attempt 1→2 and 2→3
 
+    @pytest.mark.unit
+    def test_retry_backoff_is_capped_and_jittered(self, monkeypatch):
+        """Backoff should grow exponentially up to RETRY_BACKOFF_MAX, with jitter on top."""
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.tautulli_client.time.sleep", lambda s: sleep_calls.append(s))
+        monkeypatch.setattr("src.tautulli_client.random.uniform", lambda a, b: b)  # maximum jitter
+
+        client = TautulliClient("http://tautulli:8181", "key")
+
+        def always_fail(url, params, timeout):
+            raise requests.RequestException("down")
+
+        monkeypatch.setattr(client._session, "get", always_fail)
+
+        with pytest.raises(requests.RequestException):
+            client._request("get_recently_added", max_retries=7)
+
+        assert sleep_calls == [1.5, 3.0, 6.0, 12.0, 24.0, 45.0]  # 2**5 = 32 is capped to 30, then x1.5
+
+    @staticmethod
+    def _http_error(status_code: int, headers: dict[str, str] | None = None) -> requests.HTTPError:
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        return requests.HTTPError(f"{status_code} Error", response=response)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("status_code", [400, 401, 403, 404])
+    def test_request_does_not_retry_permanent_client_errors(self, monkeypatch, status_code):
+        """Non-retryable 4xx responses should fail on the first attempt without sleeping."""
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.tautulli_client.time.sleep", lambda s: sleep_calls.append(s))
+
+        client = TautulliClient("http://tautulli:8181", "key")
+        mock_get = Mock(side_effect=self._http_error(status_code))
+        monkeypatch.setattr(client._session, "get", mock_get)
+
+        with pytest.raises(requests.HTTPError):
+            client._request("get_recently_added", max_retries=3)
+
+        assert mock_get.call_count == 1
+        assert sleep_calls == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("status_code", [408, 500, 503])
+    def test_request_retries_transient_http_errors(self, monkeypatch, status_code):
+        """Timeouts and server errors should still go through the backoff loop."""
+        monkeypatch.setattr("src.tautulli_client.time.sleep", lambda _: None)
+
+        client = TautulliClient("http://tautulli:8181", "key")
+        mock_get = Mock(side_effect=self._http_error(status_code))
+        monkeypatch.setattr(client._session, "get", mock_get)
+
+        with pytest.raises(requests.HTTPError):
+            client._request("get_recently_added", max_retries=3)
+
+        assert mock_get.call_count == 3
+
+    @pytest.mark.unit
+    def test_request_honors_retry_after_on_429(self, monkeypatch):
+        """A 429 should wait at least as long as its Retry-After header asks."""
+        sleep_calls: list[float] = []
+        monkeypatch.setattr("src.tautulli_client.time.sleep", lambda s: sleep_calls.append(s))
+        monkeypatch.setattr("src.tautulli_client.random.uniform", lambda a, b: 0.0)
+
+        client = TautulliClient("http://tautulli:8181", "key")
+        mock_get = Mock(side_effect=self._http_error(429, {"Retry-After": "7"}))
+        monkeypatch.setattr(client._session, "get", mock_get)
+
+        with pytest.raises(requests.HTTPError):
+            client._request("get_recently_added", max_retries=2)
+
+        assert sleep_calls == [7.0]
+
+    @pytest.mark.unit
+    def test_request_stops_retrying_at_deadline(self, monkeypatch):
+        """Retries should stop once the next backoff would end past REQUEST_DEADLINE."""
+        now = [0.0]
+        monkeypatch.setattr("src.tautulli_client.time.monotonic", lambda: now[0])
+        monkeypatch.setattr("src.tautulli_client.time.sleep", lambda s: now.__setitem__(0, now[0] + s))
+        monkeypatch.setattr("src.tautulli_client.random.uniform", lambda a, b: 0.0)
+
+        client = TautulliClient("http://tautulli:8181", "key")
+        mock_get = Mock(side_effect=requests.ConnectionError("down"))
+        monkeypatch.setattr(client._session, "get", mock_get)
+
+        with pytest.raises(requests.ConnectionError):
+            client._request("get_recently_added", max_retries=10)
+
+        # Sleeps of 1+2+4+8+16 = 31s fit in the 60s deadline; the next 30s backoff would not
+        assert mock_get.call_count == 6
+        assert now[0] == 31.0
+
     @pytest.mark.unit
     def test_request_logs_error_on_final_failure(self, monkeypatch, caplog):
         """Final failed attempt should produce an ERROR log entry."""
@@ -347,9 +529,9 @@ class TestTautulliClientRetryLogic:
         def always_fail(url, params, timeout):
             raise requests.RequestException("persists")
 
-        monkeypatch.setattr("src.tautulli_client.requests.get", always_fail)
-
         client = TautulliClient("http://tautulli:8181", "key")
+        monkeypatch.setattr(client._session, "get", always_fail)
+
         caplog.set_level("ERROR")
 
         with pytest.raises(requests.RequestException):
@@ -357,3 +539,65 @@ class TestTautulliClientRetryLogic:
 
         error_records = [r for r in caplog.records if r.levelname == "ERROR"]
         assert error_records, "Expected error-level log on final failed attempt"
+
+
+class TestTautulliClientSession:
+    """Tests for TautulliClient HTTP session lifecycle."""
+
+    @pytest.mark.unit
+    def test_session_requests_json_with_compression(self):
+        """The session should ask for JSON and keep requests' gzip/deflate Accept-Encoding default."""
+        client = TautulliClient("http://tautulli:8181", "key")
+
+        assert client._session.headers["Accept"] == "application/json"
+        assert "gzip" in client._session.headers["Accept-Encoding"]
+
+    @pytest.mark.unit
+    def test_requests_reuse_one_session(self, monkeypatch):
+        """Every API call should go through the client's pooled session."""
+        client = TautulliClient("http://tautulli:8181", "key")
+        calls: list[str] = []
+
+        def fake_get(url, params, timeout):
+            calls.append(params["cmd"])
+            resp = Mock()
+            resp.raise_for_status.return_value = None
+            resp.json.return_value = {"response": {"result": "success", "data": {"machine_identifier": "abc"}}}
+            return resp
+
+        monkeypatch.setattr(client._session, "get", fake_get)
+
+        client.get_server_identity()
+        client.invalidate_identity()
+        client.get_server_identity()
+
+        assert calls == ["get_server_identity", "get_server_identity"]
+
+    @pytest.mark.unit
+    def test_request_targets_api_endpoint_with_auth_and_command(self, monkeypatch):
+        """Requests should hit /api/v2 on the normalised base URL with apikey, cmd and extra params."""
+        client = TautulliClient("http://tautulli:8181/", "key")
+        captured: dict[str, object] = {}
+
+        def fake_get(url, params, timeout):
+            captured.update(url=url, params=params)
+            resp = Mock()
+            resp.raise_for_status.return_value = None
+            resp.json.return_value = {"response": {"result": "success", "data": {"recently_added": []}}}
+            return resp
+
+        monkeypatch.setattr(client._session, "get", fake_get)
+
+        client._request("get_recently_added", count=25)
+
+        assert captured["url"] == "http://tautulli:8181/api/v2"
+        assert captured["params"] == {"apikey": "key", "cmd": "get_recently_added", "count": 25}
+
+    @pytest.mark.unit
+    def test_context_manager_closes_session(self, monkeypatch):
+        """Leaving the with-block should close the underlying session."""
+        close = Mock()
+        with TautulliClient("http://tautulli:8181", "key") as client:
+            monkeypatch.setattr(client._session, "close", close)
+
+        close.assert_called_once_with()